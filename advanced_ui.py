@@ -4,8 +4,14 @@ Provides enhanced interactive elements, animations, and modern interface feature
 """
 
 import asyncio
+import heapq
+import html
 import logging
+import time
+from collections import Counter, OrderedDict
 from datetime import datetime
+from itertools import islice
+from operator import itemgetter
 from typing import Dict, List, Any, Optional, Tuple
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup, Update
 from telegram.ext import ContextTypes
@@ -13,78 +19,106 @@ from utils import format_uptime_message, get_status_emoji, truncate_url
 
 logger = logging.getLogger(__name__)
 
+# Buttons repeated across many keyboards; button objects are immutable so one instance is shared
+BTN_MAIN_MENU = InlineKeyboardButton("🏠 Main Menu", callback_data="main_menu")
+BTN_ADD_URL = InlineKeyboardButton("➕ Add URL", callback_data="add_url_wizard")
+BTN_REFRESH_URLS = InlineKeyboardButton("🔄 Refresh", callback_data="refresh_urls")
+
 class AdvancedUI:
+    # Render lookup tables shared by every instance
+    _STATUS_EMOJIS = {
+        "online": "🟢",
+        "offline": "🔴",
+        "pending": "🟡"
+    }
+    _SPEED_EMOJIS = ((1.0, "⚡"), (3.0, "🟡"))  # (upper bound in seconds, emoji)
+    _SPEED_LABELS = ((1.0, "⚡ Fast"), (3.0, "🟡 Normal"))
+    _HEALTH_LEVELS = ((95, "💚", "EXCELLENT"), (80, "💛", "GOOD"), (50, "🧡", "WARNING"))  # (min uptime %, ...)
+    _PERFORMANCE_LABELS = ((99, "🟢 Excellent"), (95, "🟡 Good"), (80, "🟠 Fair"))
+    
+    # Static keyboards as rows of (label, callback_data)
+    _MAIN_MENU_SPEC = (
+        (("➕ Add URL", "add_url_wizard"), ("🗑️ Remove URL", "remove_url_menu")),
+        (("🌐 View URLs", "main_urls"), ("📊 Stats", "main_stats")),
+        (("⚡ Quick Ping", "quick_ping"), ("⚙️ Settings", "main_settings")),
+        (("🔔 Alerts", "view_alerts"), ("📈 Analytics", "analytics")),
+        (("👥 Admin Panel", "admin_panel"), ("ℹ️ Help", "help_menu")),
+        (("🔄 Refresh", "refresh_main"),),
+    )
+    _STATS_DASHBOARD_SPEC = (
+        (("📊 24h Stats", "stats_24h"), ("📈 7d Trends", "stats_7d")),
+        (("⚡ Response Times", "response_times"), ("📉 Incidents", "view_incidents")),
+        (("🎯 Top Performers", "top_urls"), ("⚠️ Problem URLs", "problem_urls")),
+        (("📱 Export Data", "export_data"), ("🏠 Main Menu", "main_menu")),
+    )
+    _QUICK_ACTIONS_SPEC = (
+        (("🚀 Ping All Now", "ping_all_instant"), ("🔥 Emergency Check", "emergency_check")),
+        (("📱 Mobile View", "mobile_view"), ("💻 Desktop View", "desktop_view")),
+        (("🏠 Main Menu", "main_menu"),),
+    )
+    _SETTINGS_SPEC = (
+        (("⏰ Ping Interval", "set_interval"), ("🔔 Notifications", "notification_settings")),
+        (("📊 Report Format", "report_format"), ("🎨 UI Theme", "ui_theme")),
+        (("🔒 Security", "security_settings"), ("💾 Data Management", "data_settings")),
+        (("🏠 Main Menu", "main_menu"),),
+    )
+    
     def __init__(self, url_monitor, config):
         self.url_monitor = url_monitor
         self.config = config
-        self.loading_frames = ["⏳", "⌛", "⏳", "⌛"]
-        self.progress_frames = ["▱▱▱▱▱", "▰▱▱▱▱", "▰▰▱▱▱", "▰▰▰▱▱", "▰▰▰▰▱", "▰▰▰▰▰"]
         
-    async def create_animated_loading(self, message, duration: int = 3):
-        """Create animated loading effect"""
-        original_text = message.text
-        
-        for i in range(duration * 2):  # 2 frames per second
-            frame = self.loading_frames[i % len(self.loading_frames)]
-            animated_text = f"{frame} Processing...\n\n{original_text}"
-            
-            try:
-                await message.edit_text(animated_text, parse_mode='Markdown')
-                await asyncio.sleep(0.5)
-            except Exception:
-                break  # Stop if message can't be edited
+        # Static keyboards never change, so build them once and share them
+        self._main_menu_markup = self._build_keyboard(self._MAIN_MENU_SPEC)
+        self._stats_dashboard_markup = self._build_keyboard(self._STATS_DASHBOARD_SPEC)
+        self._quick_actions_markup = self._build_keyboard(self._QUICK_ACTIONS_SPEC)
+        self._settings_markup = self._build_keyboard(self._SETTINGS_SPEC)
+        
+        # Rendered dashboards keyed by a fingerprint of the URL data
+        self._list_cache: Dict[tuple, Tuple[str, InlineKeyboardMarkup]] = {}
+        self._stats_cache: Dict[tuple, Tuple[str, InlineKeyboardMarkup]] = {}
+        self._render_cache_size = 128
+        self._now_cache: Tuple[float, str] = (0.0, "")  # (monotonic time, HH:MM:SS)
+        
+        # Per-URL 24h uptime stats: (admin_chat_id, url) -> (monotonic time, stats);
+        # least recently viewed entries go first so removed URLs cannot pile up
+        self.uptime_cache_ttl = 30  # seconds
+        self._uptime_cache: OrderedDict = OrderedDict()
+        self._uptime_cache_size = 256
+        
+    @staticmethod
+    def _build_keyboard(spec) -> InlineKeyboardMarkup:
+        """Build a keyboard from rows of (label, callback_data) pairs"""
+        return InlineKeyboardMarkup([
+            [InlineKeyboardButton(label, callback_data=callback_data) for label, callback_data in row]
+            for row in spec
+        ])
     
     def create_main_menu_keyboard(self) -> InlineKeyboardMarkup:
         """Create enhanced main menu with modern design"""
-        keyboard = [
-            [
-                InlineKeyboardButton("➕ Add URL", callback_data="add_url_wizard"),
-                InlineKeyboardButton("🗑️ Remove URL", callback_data="remove_url_menu")
-            ],
-            [
-                InlineKeyboardButton("🌐 View URLs", callback_data="main_urls"),
-                InlineKeyboardButton("📊 Stats", callback_data="main_stats")
-            ],
-            [
-                InlineKeyboardButton("⚡ Quick Ping", callback_data="quick_ping"),
-                InlineKeyboardButton("⚙️ Settings", callback_data="main_settings")
-            ],
-            [
-                InlineKeyboardButton("🔔 Alerts", callback_data="view_alerts"),
-                InlineKeyboardButton("📈 Analytics", callback_data="analytics")
-            ],
-            [
-                InlineKeyboardButton("👥 Admin Panel", callback_data="admin_panel"),
-                InlineKeyboardButton("ℹ️ Help", callback_data="help_menu")
-            ],
-            [
-                InlineKeyboardButton("🔄 Refresh", callback_data="refresh_main")
-            ]
-        ]
-        return InlineKeyboardMarkup(keyboard)
+        return self._main_menu_markup
     
     def create_url_management_keyboard(self, urls: Dict[str, Any]) -> InlineKeyboardMarkup:
         """Create enhanced URL management interface"""
         keyboard = []
         
         # Add URL cards (max 5 for clean display)
-        displayed_urls = list(urls.items())[:5]
+        displayed_urls = islice(urls.items(), 5)
         for url, data in displayed_urls:
             status = data.get("status", "pending")
-            emoji = get_status_emoji(status)
-            short_url = truncate_url(url, 25)
+            emoji = data.get("status_emoji") or get_status_emoji(status)
+            short_url = data.get("short_url_25") or truncate_url(url, 25)
             
             keyboard.append([
                 InlineKeyboardButton(
                     f"{emoji} {short_url}",
-                    callback_data=f"url_detail:{hash(url) % 10000}"
+                    callback_data=f"url_detail:{data['id']}"
                 ),
-                InlineKeyboardButton("🗑️", callback_data=f"remove_url:{hash(url) % 10000}")
+                InlineKeyboardButton("🗑️", callback_data=f"remove_url:{data['id']}")
             ])
         
         # Action buttons
         keyboard.append([
-            InlineKeyboardButton("➕ Add URL", callback_data="add_url_wizard"),
+            BTN_ADD_URL,
             InlineKeyboardButton("🔄 Refresh All", callback_data="refresh_urls")
         ])
         
@@ -94,7 +128,7 @@ class AdvancedUI:
             ])
         
         keyboard.append([
-            InlineKeyboardButton("🏠 Main Menu", callback_data="main_menu")
+            BTN_MAIN_MENU
         ])
         
         return InlineKeyboardMarkup(keyboard)
@@ -109,15 +143,15 @@ class AdvancedUI:
             ])
         else:
             # Add remove buttons for each URL
-            for url, data in list(urls.items())[:8]:  # Show max 8 URLs
+            for url, data in islice(urls.items(), 8):  # Show max 8 URLs
                 status = data.get("status", "pending")
-                emoji = get_status_emoji(status)
-                short_url = truncate_url(url, 30)
+                emoji = data.get("status_emoji") or get_status_emoji(status)
+                short_url = data.get("short_url_30") or truncate_url(url, 30)
                 
                 keyboard.append([
                     InlineKeyboardButton(
                         f"🗑️ {emoji} {short_url}",
-                        callback_data=f"remove_url:{hash(url) % 10000}"
+                        callback_data=f"remove_url:{data['id']}"
                     )
                 ])
             
@@ -127,102 +161,62 @@ class AdvancedUI:
                 ])
         
         # Navigation buttons
-        keyboard.extend([
-            [
-                InlineKeyboardButton("➕ Add URL", callback_data="add_url_wizard"),
-                InlineKeyboardButton("🌐 View URLs", callback_data="main_urls")
-            ],
-            [
-                InlineKeyboardButton("🏠 Main Menu", callback_data="main_menu")
-            ]
+        keyboard.append([
+            BTN_ADD_URL,
+            InlineKeyboardButton("🌐 View URLs", callback_data="main_urls")
+        ])
+        keyboard.append([
+            BTN_MAIN_MENU
         ])
         
         return InlineKeyboardMarkup(keyboard)
     
     def create_stats_dashboard_keyboard(self) -> InlineKeyboardMarkup:
         """Create advanced statistics dashboard"""
-        keyboard = [
-            [
-                InlineKeyboardButton("📊 24h Stats", callback_data="stats_24h"),
-                InlineKeyboardButton("📈 7d Trends", callback_data="stats_7d")
-            ],
-            [
-                InlineKeyboardButton("⚡ Response Times", callback_data="response_times"),
-                InlineKeyboardButton("📉 Incidents", callback_data="view_incidents")
-            ],
-            [
-                InlineKeyboardButton("🎯 Top Performers", callback_data="top_urls"),
-                InlineKeyboardButton("⚠️ Problem URLs", callback_data="problem_urls")
-            ],
-            [
-                InlineKeyboardButton("📱 Export Data", callback_data="export_data"),
-                InlineKeyboardButton("🏠 Main Menu", callback_data="main_menu")
-            ]
-        ]
-        return InlineKeyboardMarkup(keyboard)
+        return self._stats_dashboard_markup
     
     def create_quick_actions_keyboard(self) -> InlineKeyboardMarkup:
         """Create quick action buttons"""
-        keyboard = [
-            [
-                InlineKeyboardButton("🚀 Ping All Now", callback_data="ping_all_instant"),
-                InlineKeyboardButton("🔥 Emergency Check", callback_data="emergency_check")
-            ],
-            [
-                InlineKeyboardButton("📱 Mobile View", callback_data="mobile_view"),
-                InlineKeyboardButton("💻 Desktop View", callback_data="desktop_view")
-            ],
-            [
-                InlineKeyboardButton("🏠 Main Menu", callback_data="main_menu")
-            ]
-        ]
-        return InlineKeyboardMarkup(keyboard)
+        return self._quick_actions_markup
     
     def create_settings_keyboard(self) -> InlineKeyboardMarkup:
         """Create advanced settings interface"""
-        keyboard = [
-            [
-                InlineKeyboardButton("⏰ Ping Interval", callback_data="set_interval"),
-                InlineKeyboardButton("🔔 Notifications", callback_data="notification_settings")
-            ],
-            [
-                InlineKeyboardButton("📊 Report Format", callback_data="report_format"),
-                InlineKeyboardButton("🎨 UI Theme", callback_data="ui_theme")
-            ],
-            [
-                InlineKeyboardButton("🔒 Security", callback_data="security_settings"),
-                InlineKeyboardButton("💾 Data Management", callback_data="data_settings")
-            ],
-            [
-                InlineKeyboardButton("🏠 Main Menu", callback_data="main_menu")
-            ]
-        ]
-        return InlineKeyboardMarkup(keyboard)
+        return self._settings_markup
     
-    async def create_progress_animation(self, message, total_steps: int, current_step: int):
-        """Create progress bar animation"""
-        progress_index = min(int((current_step / total_steps) * len(self.progress_frames)), len(self.progress_frames) - 1)
-        progress_bar = self.progress_frames[progress_index]
-        percentage = int((current_step / total_steps) * 100)
-        
-        animated_text = f"🔄 **Processing URLs**\n\n"
-        animated_text += f"Progress: {progress_bar} {percentage}%\n"
-        animated_text += f"Step {current_step}/{total_steps}\n\n"
-        animated_text += "Please wait..."
-        
-        try:
-            await message.edit_text(animated_text, parse_mode='Markdown')
-        except Exception:
-            pass  # Ignore edit errors
+    def _fingerprint(self, urls: Dict[str, Any]) -> int:
+        """Cheap hash of the URL fields that affect rendering"""
+        return hash(tuple(
+            (url, data.get("status"), data.get("last_check"), data.get("response_time"))
+            for url, data in urls.items()
+        ))
+    
+    def _cache_store(self, cache: Dict[tuple, Any], key: tuple, value: Any):
+        """Store a rendered result, evicting the oldest entry when full"""
+        if len(cache) >= self._render_cache_size:
+            del cache[next(iter(cache))]
+        cache[key] = value
     
     def format_enhanced_url_list(self, urls: Dict[str, Any], page: int = 0, per_page: int = 5) -> Tuple[str, InlineKeyboardMarkup]:
         """Format URL list with enhanced visual design"""
+        # Stale or hand-crafted page numbers land on the nearest real page
+        page = max(0, min(page, (len(urls) - 1) // per_page))
+        key = (len(urls), page, per_page, self._fingerprint(urls))
+        cached = self._list_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        result = self._render_url_list(urls, page, per_page)
+        self._cache_store(self._list_cache, key, result)
+        return result
+    
+    def _render_url_list(self, urls: Dict[str, Any], page: int, per_page: int) -> Tuple[str, InlineKeyboardMarkup]:
+        """Render the paginated URL dashboard"""
         if not urls:
-            message = "📭 **No URLs Being Monitored**\n\n"
+            message = "📭 <b>No URLs Being Monitored</b>\n\n"
             message += "🚀 Ready to add your first URL?\n"
-            message += "Click **Add URL** to get started!"
+            message += "Click <b>Add URL</b> to get started!"
             
-            keyboard = [[InlineKeyboardButton("➕ Add URL", callback_data="add_url_wizard")]]
+            keyboard = [[BTN_ADD_URL]]
             return message, InlineKeyboardMarkup(keyboard)
         
         # Pagination
@@ -230,10 +224,9 @@ class AdvancedUI:
         start_idx = page * per_page
         end_idx = min(start_idx + per_page, total_urls)
         
-        url_items = list(urls.items())
-        current_urls = url_items[start_idx:end_idx]
+        current_urls = islice(urls.items(), start_idx, end_idx)
         
-        message = f"🌐 **URL Dashboard** ({total_urls} total)\n\n"
+        parts = [f"🌐 <b>URL Dashboard</b> ({total_urls} total)\n\n"]
         
         for i, (url, data) in enumerate(current_urls, 1):
             status = data.get("status", "pending")
@@ -241,35 +234,24 @@ class AdvancedUI:
             response_time = data.get("response_time")
             
             # Status with enhanced emojis
-            status_emojis = {
-                "online": "🟢",
-                "offline": "🔴",
-                "pending": "🟡"
-            }
-            emoji = status_emojis.get(status, "⚪")
+            emoji = self._STATUS_EMOJIS.get(status, "⚪")
             
-            message += f"**{start_idx + i}.** {emoji} **{status.upper()}**\n"
-            message += f"   🌐 `{truncate_url(url, 50)}`\n"
+            parts.append(f"<b>{start_idx + i}.</b> {emoji} <b>{status.upper()}</b>\n")
+            short_url = html.escape(data.get("short_url_50") or truncate_url(url, 50), quote=False)
+            parts.append(f"   🌐 <code>{short_url}</code>\n")
             
             if last_check:
-                try:
-                    check_time = datetime.fromisoformat(last_check).strftime("%H:%M:%S")
-                    message += f"   🕐 {check_time}"
-                except:
-                    message += f"   🕐 {last_check}"
+                # Stored timestamps are ISO strings, so the time sits at a fixed offset
+                check_time = data.get("last_check_hms") or last_check[11:19]
+                parts.append(f"   🕐 {check_time}")
             else:
-                message += "   🕐 Never checked"
+                parts.append("   🕐 Never checked")
             
             if response_time:
-                if response_time < 1.0:
-                    speed_emoji = "⚡"
-                elif response_time < 3.0:
-                    speed_emoji = "🟡"
-                else:
-                    speed_emoji = "🔴"
-                message += f" | {speed_emoji} {response_time:.3f}s"
+                speed_emoji = next((e for t, e in self._SPEED_EMOJIS if response_time < t), "🔴")
+                parts.append(f" | {speed_emoji} {response_time:.3f}s")
             
-            message += "\n\n"
+            parts.append("\n\n")
         
         # Create pagination keyboard
         keyboard = []
@@ -285,76 +267,95 @@ class AdvancedUI:
             keyboard.append(nav_buttons)
         
         # Action buttons
-        keyboard.extend([
-            [
-                InlineKeyboardButton("➕ Add URL", callback_data="add_url_wizard"),
-                InlineKeyboardButton("🔄 Refresh", callback_data="refresh_urls")
-            ],
-            [
-                InlineKeyboardButton("📊 View Stats", callback_data="main_stats"),
-                InlineKeyboardButton("🏠 Main Menu", callback_data="main_menu")
-            ]
+        keyboard.append([
+            BTN_ADD_URL,
+            BTN_REFRESH_URLS
+        ])
+        keyboard.append([
+            InlineKeyboardButton("📊 View Stats", callback_data="main_stats"),
+            BTN_MAIN_MENU
         ])
         
-        message += f"📄 Page {page + 1} of {(total_urls - 1) // per_page + 1}"
+        parts.append(f"📄 Page {page + 1} of {(total_urls - 1) // per_page + 1}")
         
-        return message, InlineKeyboardMarkup(keyboard)
+        return "".join(parts), InlineKeyboardMarkup(keyboard)
     
     def format_advanced_stats(self, urls: Dict[str, Any]) -> Tuple[str, InlineKeyboardMarkup]:
         """Format advanced statistics with visual elements"""
+        key = (len(urls), self._fingerprint(urls))
+        cached = self._stats_cache.get(key)
+        if cached is None:
+            cached = self._render_stats(urls)
+            self._cache_store(self._stats_cache, key, cached)
+        
+        message, reply_markup = cached
+        if urls:
+            # Timestamp stays fresh so "Refresh" always produces a new message
+            message += f"\n🕐 <b>Last Updated:</b> {self._now_hms()}"
+        return message, reply_markup
+    
+    def _now_hms(self) -> str:
+        """Current HH:MM:SS, reformatted at most once per second"""
+        now = time.monotonic()
+        if now - self._now_cache[0] >= 1.0:
+            self._now_cache = (now, datetime.now().strftime('%H:%M:%S'))
+        return self._now_cache[1]
+    
+    def _render_stats(self, urls: Dict[str, Any]) -> Tuple[str, InlineKeyboardMarkup]:
+        """Render the statistics dashboard without the timestamp line"""
         if not urls:
-            message = "📊 **Statistics Dashboard**\n\n"
+            message = "📊 <b>Statistics Dashboard</b>\n\n"
             message += "📭 No data available yet.\n"
             message += "Add some URLs to see statistics!"
             
-            keyboard = [[InlineKeyboardButton("➕ Add URL", callback_data="add_url_wizard")]]
+            keyboard = [[BTN_ADD_URL]]
             return message, InlineKeyboardMarkup(keyboard)
         
-        message = "📊 **Advanced Statistics Dashboard**\n\n"
-        
-        # Overall stats
+        # Overall stats, counted in a single pass over the URLs
         total_urls = len(urls)
-        online_count = sum(1 for data in urls.values() if data.get("status") == "online")
-        offline_count = sum(1 for data in urls.values() if data.get("status") == "offline")
-        pending_count = sum(1 for data in urls.values() if data.get("status") == "pending")
+        status_counts = Counter()
+        online_urls = []
+        for url, data in urls.items():
+            status = data.get("status")
+            status_counts[status] += 1
+            if status == "online":
+                # Sort key collected here so the top-3 pick needs no second lookup
+                online_urls.append((url, data, data.get("response_time") or float("inf")))
+        
+        online_count = status_counts["online"]
+        offline_count = status_counts["offline"]
+        pending_count = status_counts["pending"]
         
         overall_uptime = (online_count / total_urls * 100) if total_urls > 0 else 0
         
         # Visual health indicator
-        if overall_uptime >= 95:
-            health_emoji = "💚"
-            health_status = "EXCELLENT"
-        elif overall_uptime >= 80:
-            health_emoji = "💛"
-            health_status = "GOOD"
-        elif overall_uptime >= 50:
-            health_emoji = "🧡"
-            health_status = "WARNING"
-        else:
-            health_emoji = "❤️"
-            health_status = "CRITICAL"
-        
-        message += f"🎯 **Overall Health: {health_emoji} {health_status}**\n"
-        message += f"📈 **Uptime: {overall_uptime:.1f}%**\n\n"
-        
-        message += f"📊 **Quick Overview**\n"
-        message += f"🟢 Online: {online_count}\n"
-        message += f"🔴 Offline: {offline_count}\n"
-        message += f"🟡 Pending: {pending_count}\n"
-        message += f"📋 Total: {total_urls}\n\n"
-        
-        # Individual URL stats (top 3)
-        message += "🏆 **Top Performing URLs**\n"
-        online_urls = [(url, data) for url, data in urls.items() if data.get("status") == "online"]
+        health_emoji, health_status = next(
+            (level[1:] for level in self._HEALTH_LEVELS if overall_uptime >= level[0]),
+            ("❤️", "CRITICAL")
+        )
+        
+        parts = [
+            "📊 <b>Advanced Statistics Dashboard</b>\n\n",
+            f"🎯 <b>Overall Health: {health_emoji} {health_status}</b>\n",
+            f"📈 <b>Uptime: {overall_uptime:.1f}%</b>\n\n",
+            "📊 <b>Quick Overview</b>\n",
+            f"🟢 Online: {online_count}\n",
+            f"🔴 Offline: {offline_count}\n",
+            f"🟡 Pending: {pending_count}\n",
+            f"📋 Total: {total_urls}\n\n",
+            # Individual URL stats (top 3)
+            "🏆 <b>Top Performing URLs</b>\n",
+        ]
         
         if online_urls:
-            for i, (url, data) in enumerate(online_urls[:3], 1):
-                response_time = data.get("response_time", 0)
-                message += f"{i}. ⚡ `{truncate_url(url, 30)}` ({response_time:.3f}s)\n"
+            # Partial sort: only the 3 fastest URLs are needed
+            top_urls = heapq.nsmallest(3, online_urls, key=itemgetter(2))
+            for i, (url, data, _) in enumerate(top_urls, 1):
+                response_time = data.get("response_time") or 0
+                short_url = html.escape(data.get("short_url_30") or truncate_url(url, 30), quote=False)
+                parts.append(f"{i}. ⚡ <code>{short_url}</code> ({response_time:.3f}s)\n")
         else:
-            message += "No online URLs currently\n"
-        
-        message += f"\n🕐 **Last Updated:** {datetime.now().strftime('%H:%M:%S')}"
+            parts.append("No online URLs currently\n")
         
         keyboard = [
             [
@@ -363,80 +364,81 @@ class AdvancedUI:
             ],
             [
                 InlineKeyboardButton("🔄 Refresh", callback_data="main_stats"),
-                InlineKeyboardButton("🏠 Main Menu", callback_data="main_menu")
+                BTN_MAIN_MENU
             ]
         ]
         
-        return message, InlineKeyboardMarkup(keyboard)
+        return "".join(parts), InlineKeyboardMarkup(keyboard)
     
-    def create_url_detail_view(self, url: str, url_data: Dict[str, Any]) -> Tuple[str, InlineKeyboardMarkup]:
+    def _get_cached_uptime_stats(self, url: str, admin_chat_id: str) -> Dict[str, Any]:
+        """Get 24h uptime stats, reusing a recent result for repeated detail views"""
+        key = (admin_chat_id, url)
+        entry = self._uptime_cache.get(key)
+        now = time.monotonic()
+        if entry and now - entry[0] < self.uptime_cache_ttl:
+            self._uptime_cache.move_to_end(key)
+            return entry[1]
+        
+        stats = self.url_monitor.get_uptime_stats(url, admin_chat_id, 24)
+        self._uptime_cache[key] = (now, stats)
+        self._uptime_cache.move_to_end(key)
+        if len(self._uptime_cache) > self._uptime_cache_size:
+            self._uptime_cache.popitem(last=False)
+        return stats
+    
+    def create_url_detail_view(self, url: str, url_data: Dict[str, Any], admin_chat_id: str) -> Tuple[str, InlineKeyboardMarkup]:
         """Create detailed view for a specific URL"""
         status = url_data.get("status", "unknown")
         last_check = url_data.get("last_check")
         response_time = url_data.get("response_time")
         added_at = url_data.get("added_at")
         
-        emoji = get_status_emoji(status)
+        emoji = url_data.get("status_emoji") or get_status_emoji(status)
         
-        message = f"🔍 **URL Details**\n\n"
-        message += f"{emoji} **Status:** {status.upper()}\n"
-        message += f"🌐 **URL:** `{url}`\n\n"
+        parts = [
+            "🔍 <b>URL Details</b>\n\n",
+            f"{emoji} <b>Status:</b> {status.upper()}\n",
+            f"🌐 <b>URL:</b> <code>{html.escape(url, quote=False)}</code>\n\n",
+        ]
         
         if last_check:
-            try:
-                check_time = datetime.fromisoformat(last_check).strftime("%Y-%m-%d %H:%M:%S")
-                message += f"🕐 **Last Check:** {check_time}\n"
-            except:
-                message += f"🕐 **Last Check:** {last_check}\n"
+            check_time = url_data.get("last_check_full") or last_check[:19].replace("T", " ")
+            parts.append(f"🕐 <b>Last Check:</b> {check_time}\n")
         
         if response_time is not None:
-            if response_time < 1.0:
-                speed_text = "⚡ Fast"
-            elif response_time < 3.0:
-                speed_text = "🟡 Normal"
-            else:
-                speed_text = "🔴 Slow"
-            message += f"⏱️ **Response Time:** {response_time:.3f}s ({speed_text})\n"
+            speed_text = next((e for t, e in self._SPEED_LABELS if response_time < t), "🔴 Slow")
+            parts.append(f"⏱️ <b>Response Time:</b> {response_time:.3f}s ({speed_text})\n")
         
         if added_at:
-            try:
-                added_time = datetime.fromisoformat(added_at).strftime("%Y-%m-%d")
-                message += f"📅 **Added:** {added_time}\n"
-            except:
-                message += f"📅 **Added:** {added_at}\n"
+            parts.append(f"📅 <b>Added:</b> {added_at[:10]}\n")
+        
+        url_id = url_data["id"]
         
         # Get uptime stats for this URL
-        stats = self.url_monitor.get_uptime_stats(url, 24)
+        stats = self._get_cached_uptime_stats(url, admin_chat_id)
         uptime = stats.get("uptime_percentage", 0)
         
-        message += f"\n📊 **24h Uptime:** {uptime}%\n"
+        parts.append(f"\n📊 <b>24h Uptime:</b> {uptime}%\n")
         
-        if uptime >= 99:
-            performance_text = "🟢 Excellent"
-        elif uptime >= 95:
-            performance_text = "🟡 Good"
-        elif uptime >= 80:
-            performance_text = "🟠 Fair"
-        else:
-            performance_text = "🔴 Poor"
+        performance_text = next((label for t, label in self._PERFORMANCE_LABELS if uptime >= t), "🔴 Poor")
         
-        message += f"📈 **Performance:** {performance_text}"
+        parts.append(f"📈 <b>Performance:</b> {performance_text}")
         
         keyboard = [
             [
-                InlineKeyboardButton("🔄 Test Now", callback_data=f"test_url:{hash(url) % 10000}"),
-                InlineKeyboardButton("📊 Full Stats", callback_data=f"url_stats:{hash(url) % 10000}")
+                InlineKeyboardButton("🔄 Test Now", callback_data=f"test_url:{url_id}"),
+                InlineKeyboardButton("📊 Full Stats", callback_data=f"url_stats:{url_id}")
             ],
             [
-                InlineKeyboardButton("🗑️ Remove", callback_data=f"remove_url:{hash(url) % 10000}"),
-                InlineKeyboardButton("⚙️ Settings", callback_data=f"url_settings:{hash(url) % 10000}")
+                InlineKeyboardButton("🗑️ Remove", callback_data=f"remove_url:{url_id}"),
+                InlineKeyboardButton("⚙️ Settings", callback_data=f"url_settings:{url_id}")
             ],
             [
-                InlineKeyboardButton("🏠 Main Menu", callback_data="main_menu")
+                BTN_MAIN_MENU
             ]
         ]
         
-        return message, InlineKeyboardMarkup(keyboard)
+        return "".join(parts), InlineKeyboardMarkup(keyboard)
     
     async def show_typing_animation(self, chat_id, bot, duration: int = 2):
         """Show typing indicator for better UX"""
@@ -3,25 +3,469 @@ Telegram bot command handlers and message processing
 Enhanced with advanced UI and interactive features
 """
 
+import html
 import logging
 import asyncio
-from datetime import datetime
-from typing import Dict, Any
+import time
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
+from telegram.constants import ParseMode
 from telegram.ext import ContextTypes, CallbackContext
 from url_monitor import URLMonitor
 from config import Config
 from utils import format_uptime_message, format_url_list, validate_url
-from advanced_ui import AdvancedUI
+from advanced_ui import AdvancedUI, BTN_MAIN_MENU
+from throttler import ChatThrottler
 
 logger = logging.getLogger(__name__)
 
+# Static message templates, built once at import time
+WELCOME_MSG = (
+    "🚀 <b>Advanced URL Monitor Bot</b> 🚀\n\n"
+    "Welcome to the next-generation URL monitoring system!\n\n"
+    "✨ <b>New Features:</b>\n"
+    "🎯 Smart Dashboard with Real-time Analytics\n"
+    "⚡ Lightning-fast Response Time Tracking\n"
+    "🔔 Intelligent Alert System\n"
+    "📊 Advanced Statistics &amp; Trends\n"
+    "🎨 Modern Interactive Interface\n\n"
+    "🤖 <b>AI-Powered Monitoring:</b>\n"
+    "I automatically ping your URLs every 60 seconds using advanced algorithms and alert you instantly when issues are detected!\n\n"
+    "Choose an option below to get started:"
+)
+
+HELP_BASE_MSG = (
+    "🆘 <b>Advanced Help System</b> 🆘\n\n"
+    "🚀 <b>URL Monitoring Commands:</b>\n"
+    "📌 <code>/seturl &lt;url&gt;</code> - Add URL with smart validation\n"
+    "🗑️ <code>/removeurl &lt;url&gt;</code> - Remove URL with confirmation\n"
+    "📋 <code>/listurls</code> - Interactive URL dashboard\n"
+    "📊 <code>/status</code> - Advanced analytics dashboard\n"
+    "🔄 <code>/pingnow</code> - Instant ping with progress animation\n\n"
+)
+
+HELP_ADMIN_MSG = (
+    "👥 <b>Admin Management Commands:</b>\n"
+    "➕ <code>/addadmin &lt;chat_id&gt;</code> - Add new admin user\n"
+    "➖ <code>/removeadmin &lt;chat_id&gt;</code> - Remove admin access\n"
+    "📋 <code>/listadmins</code> - View all administrators\n\n"
+)
+
+HELP_TAIL_MSG = (
+    "✨ <b>Advanced Features:</b>\n"
+    "🎯 Smart Dashboard with Real-time Updates\n"
+    "📈 Trend Analysis &amp; Performance Insights\n"
+    "🔔 Intelligent Alert System\n"
+    "⚡ Sub-second Response Time Tracking\n"
+    "📱 Mobile-Optimized Interface\n"
+    "🎨 Interactive Buttons &amp; Animations\n"
+    "💾 Persistent Data with Auto-Recovery\n\n"
+    "🎨 <b>Status Indicators:</b>\n"
+    "🟢 Online - Excellent Performance\n"
+    "🟡 Warning - Slower Response\n"
+    "🔴 Offline - Service Down\n"
+    "⏳ Pending - Initial Check\n\n"
+    "💡 <b>Pro Tips:</b>\n"
+    "• Use interactive buttons for faster navigation\n"
+    "• Check the dashboard for detailed insights\n"
+    "• Set up multiple URLs for comprehensive monitoring"
+)
+
+HELP_ADMIN_TIP = "\n• Use Admin Panel to manage multiple users"
+
+HELP_MSG = HELP_BASE_MSG + HELP_TAIL_MSG
+PRIMARY_HELP_MSG = HELP_BASE_MSG + HELP_ADMIN_MSG + HELP_TAIL_MSG + HELP_ADMIN_TIP
+
+ADMIN_DENIED_MSG = (
+    "🔒 Access Denied\n\n"
+    "This bot is restricted to admin use only.\n"
+    "Please contact the administrator for access."
+)
+ADMIN_DENIED_ALERT = "🔒 Access denied. Admin only."
+
+# Toasts shown when answering slow button actions, by callback key
+CALLBACK_TOASTS = {
+    "quick_ping": "⚡ Pinging your URLs...",
+    "ping_now": "⚡ Pinging your URLs...",
+    "test_url": "🧪 Testing URL...",
+    "confirm_remove": "🗑️ Removing URL...",
+}
+
+# Manual ping result row header by success flag
+PING_STATUS = {True: ("🟢", "Online"), False: ("🔴", "Offline")}
+
+# Response time classes: bisect over the upper bounds (seconds) indexes the labels
+SPEED_THRESHOLDS = (1.0, 3.0)
+QUICK_PING_SPEED_LABELS = ("⚡ Lightning", "🟡 Good", "🔴 Slow")
+TEST_URL_PERFORMANCE_LABELS = ("⚡ Excellent", "🟡 Good", "🔴 Slow")
+
+HELP_KEYBOARD = InlineKeyboardMarkup([
+    [
+        InlineKeyboardButton("🚀 Dashboard", callback_data="main_menu"),
+        InlineKeyboardButton("📊 Quick Stats", callback_data="main_stats")
+    ],
+    [
+        InlineKeyboardButton("➕ Add URL", callback_data="add_url_wizard"),
+        InlineKeyboardButton("⚙️ Settings", callback_data="main_settings")
+    ]
+])
+
+# Callback screens that never change
+MAIN_MENU_KEYBOARD = InlineKeyboardMarkup([[BTN_MAIN_MENU]])
+
+URLS_AND_MAIN_MENU_KEYBOARD = InlineKeyboardMarkup([
+    [InlineKeyboardButton("🔄 Refresh URLs", callback_data="main_urls")],
+    [BTN_MAIN_MENU]
+])
+
+QUICK_PING_RESULT_KEYBOARD = InlineKeyboardMarkup([
+    [
+        InlineKeyboardButton("📊 View Stats", callback_data="main_stats"),
+        InlineKeyboardButton("🌐 URL Dashboard", callback_data="main_urls")
+    ],
+    [
+        InlineKeyboardButton("🔄 Ping Again", callback_data="quick_ping"),
+        BTN_MAIN_MENU
+    ]
+])
+
+REMOVE_SUCCESS_KEYBOARD = InlineKeyboardMarkup([
+    [
+        InlineKeyboardButton("📋 View Remaining URLs", callback_data="main_urls"),
+        InlineKeyboardButton("➕ Add New URL", callback_data="add_url_wizard")
+    ],
+    [BTN_MAIN_MENU]
+])
+
+REMOVE_FAILED_KEYBOARD = InlineKeyboardMarkup([
+    [InlineKeyboardButton("📋 View URLs", callback_data="main_urls")],
+    [BTN_MAIN_MENU]
+])
+
+MAIN_MENU_MSG = (
+    "🚀 <b>Advanced URL Monitor Dashboard</b> 🚀\n\n"
+    "🎯 <b>System Status:</b> ⚡ Active\n"
+    "📊 <b>Real-time Monitoring:</b> Enabled\n"
+    "🔔 <b>Smart Alerts:</b> Ready\n\n"
+    "Choose an action below to continue:"
+)
+
+SETTINGS_MSG = (
+    "⚙️ <b>Advanced Settings Panel</b> ⚙️\n\n"
+    "🎨 <b>Customize Your Experience:</b>\n"
+    "Configure monitoring intervals, notification preferences,\n"
+    "and advanced features to suit your needs.\n\n"
+    "Choose a setting category:"
+)
+
+ANALYTICS_MSG = (
+    "📈 <b>Advanced Analytics Dashboard</b> 📈\n\n"
+    "🚀 <b>Coming Soon:</b>\n"
+    "• Performance trend analysis\n"
+    "• Predictive downtime alerts\n"
+    "• Custom reporting periods\n"
+    "• Export data capabilities\n"
+    "• Historical comparison charts\n\n"
+    "This feature is currently in development."
+)
+
+ALERTS_MSG = (
+    "🔔 <b>Smart Alert System</b> 🔔\n\n"
+    "🎯 <b>Alert Status:</b> Active\n"
+    "⚡ <b>Response Time:</b> Instant\n"
+    "🔄 <b>Auto-Recovery Detection:</b> Enabled\n\n"
+    "🚀 <b>Advanced Features:</b>\n"
+    "• Real-time downtime notifications\n"
+    "• Smart recovery alerts\n"
+    "• Performance degradation warnings\n"
+    "• Custom alert thresholds\n\n"
+    "All alerts are automatically sent to this chat."
+)
+
+HELP_MENU_MSG = (
+    "🆘 <b>Interactive Help Center</b> 🆘\n\n"
+    "🎯 <b>Quick Navigation:</b>\n"
+    "Use the interactive buttons for fast access to all features!\n\n"
+    "⚡ <b>Speed Tips:</b>\n"
+    "• Dashboard shows real-time status\n"
+    "• Tap URLs for detailed information\n"
+    "• Use Quick Ping for instant checks\n"
+    "• Analytics provide deep insights\n\n"
+    "🚀 <b>Pro Features:</b>\n"
+    "• Animated loading indicators\n"
+    "• Progress tracking\n"
+    "• Mobile-optimized interface\n"
+    "• Smart error handling"
+)
+
+HELP_MENU_KEYBOARD = InlineKeyboardMarkup([
+    [
+        InlineKeyboardButton("🚀 Dashboard", callback_data="main_menu"),
+        InlineKeyboardButton("📊 Quick Stats", callback_data="main_stats")
+    ],
+    [
+        InlineKeyboardButton("🌐 URLs", callback_data="main_urls"),
+        InlineKeyboardButton("⚙️ Settings", callback_data="main_settings")
+    ]
+])
+
+ADD_URL_WIZARD_MSG = (
+    "➕ <b>Smart URL Addition Wizard</b> ➕\n\n"
+    "🎯 <b>Ready to add a new URL for monitoring!</b>\n\n"
+    "✨ <b>Features:</b>\n"
+    "• Automatic URL validation\n"
+    "• Instant connectivity testing\n"
+    "• Smart protocol detection\n"
+    "• Real-time status updates\n\n"
+    "📝 <b>How to add:</b>\n"
+    "Type: <code>/seturl &lt;your-url&gt;</code>\n\n"
+    "📌 <b>Example:</b>\n"
+    "<code>/seturl https://myapp.herokuapp.com</code>\n\n"
+    "💡 <b>Tip:</b> You can omit 'https://' - I'll add it automatically!"
+)
+
+REMOVE_MENU_EMPTY_MSG = (
+    "🗑️ <b>Remove URL Menu</b> 🗑️\n\n"
+    "📭 <b>No URLs to Remove</b>\n\n"
+    "You don't have any URLs currently being monitored.\n"
+    "Add some URLs first to enable removal options!"
+)
+REMOVE_MENU_EMPTY_KEYBOARD = InlineKeyboardMarkup([
+    [
+        InlineKeyboardButton("➕ Add URL", callback_data="add_url_wizard"),
+        BTN_MAIN_MENU
+    ]
+])
+
+REMOVE_MENU_HEAD = (
+    "🗑️ <b>Smart URL Removal Wizard</b> 🗑️\n\n"
+    "🎯 <b>Ready to remove URLs from monitoring!</b>\n\n"
+    "✨ <b>Features:</b>\n"
+    "• Instant URL removal\n"
+    "• Clean database cleanup\n"
+    "• Stop monitoring immediately\n"
+    "• Smart confirmation system\n\n"
+)
+REMOVE_MENU_TAIL = (
+    "📝 <b>How to remove:</b>\n"
+    "1. Click on any URL below to select it\n"
+    "2. Confirm your removal choice\n"
+    "3. URL will be removed instantly\n\n"
+    "💡 <b>Tip:</b> You can also use <code>/removeurl &lt;url&gt;</code> command!\n\n"
+    "⚠️ <b>Note:</b> Removal is immediate and cannot be undone."
+)
+
+ADMIN_PANEL_COMMANDS = (
+    "\n<b>Quick Commands:</b>\n"
+    "• Use <code>/addadmin &lt;chat_id&gt;</code> to add new admin\n"
+    "• Use <code>/removeadmin &lt;chat_id&gt;</code> to remove admin\n"
+    "• Use <code>/listadmins</code> for complete list"
+)
+ADMIN_PANEL_KEYBOARD = InlineKeyboardMarkup([
+    [
+        InlineKeyboardButton("➕ Add Admin", callback_data="add_admin_help"),
+        InlineKeyboardButton("➖ Remove Admin", callback_data="remove_admin_help")
+    ],
+    [
+        InlineKeyboardButton("📋 Full Admin List", callback_data="show_all_admins"),
+        InlineKeyboardButton("ℹ️ How to Get Chat ID", callback_data="chat_id_help")
+    ],
+    [BTN_MAIN_MENU]
+])
+
 class BotHandlers:
     def __init__(self, url_monitor: URLMonitor, config: Config):
         self.url_monitor = url_monitor
         self.config = config
         self.advanced_ui = AdvancedUI(url_monitor, config)
-        self.url_hash_map = {}  # Store URL hash mappings for callbacks
+        # All sends/edits share the Application's keep-alive connection pool (see main.py);
+        # the throttler only spaces them out per chat
+        self.throttler = ChatThrottler()
+        
+        # Fire-and-forget tasks, referenced until done so they are not garbage collected
+        self._background_tasks: set = set()
+        
+        # Content hash of the last edit per (chat_id, message_id), oldest first
+        self._last_edit: OrderedDict = OrderedDict()
+        self._last_edit_size = 1000
+        
+        # Rendered URL dashboard pages keyed by (chat_id, urls version, page), oldest first;
+        # the version only moves on status changes, so check times refresh by TTL
+        self._page_cache: OrderedDict = OrderedDict()  # key -> (monotonic time, render)
+        self._page_cache_size = 200
+        self.page_cache_ttl = 5.0  # seconds
+        
+        # Placeholder messages are only sent when the real work outlasts these delays
+        self.placeholder_delay = 0.3
+        self.ping_placeholder_delay = 0.5
+        self.quick_ping_placeholder_delay = 0.8
+        
+        # Static keyboards attached to command replies, built once
+        self._kb_no_urls = InlineKeyboardMarkup([
+            [InlineKeyboardButton("➕ Add URL", callback_data="help_seturl")]
+        ])
+        self._kb_list_urls = InlineKeyboardMarkup([
+            [InlineKeyboardButton("📊 Show Status", callback_data="show_status")],
+            [InlineKeyboardButton("🔄 Ping Now", callback_data="ping_now")]
+        ])
+        self._kb_status = InlineKeyboardMarkup([
+            [InlineKeyboardButton("🔄 Refresh Stats", callback_data="show_status")],
+            [InlineKeyboardButton("📋 List URLs", callback_data="list_urls")]
+        ])
+        self._kb_ping_results = InlineKeyboardMarkup([
+            [InlineKeyboardButton("📊 Show Status", callback_data="show_status")],
+            [InlineKeyboardButton("📋 List URLs", callback_data="list_urls")]
+        ])
+        self._kb_after_remove = InlineKeyboardMarkup([
+            [InlineKeyboardButton("📋 List Remaining URLs", callback_data="list_urls")]
+        ])
+        self._kb_fallback = InlineKeyboardMarkup([
+            [InlineKeyboardButton("📋 List URLs", callback_data="list_urls")],
+            [InlineKeyboardButton("📊 Show Status", callback_data="show_status")],
+            [InlineKeyboardButton("🆘 Help", callback_data="help")]
+        ])
+        
+        # /seturl keyboard: static rows cached, "Test Now" row built per URL
+        self._btn_view_dashboard = InlineKeyboardButton("📊 View Dashboard", callback_data="main_urls")
+        self._kb_after_add_rows = (
+            (
+                InlineKeyboardButton("📈 View Stats", callback_data="main_stats"),
+                InlineKeyboardButton("🔄 Ping All", callback_data="quick_ping")
+            ),
+            (BTN_MAIN_MENU,)
+        )
+        
+        # Callback routing: exact callback_data matches, then "prefix:arg" routes
+        self._exact_callbacks = {
+            "main_menu": self._handle_main_menu_callback,
+            "main_urls": self._handle_main_urls_callback,
+            "main_stats": self._handle_main_stats_callback,
+            "main_settings": self._handle_settings_callback,
+            "quick_ping": self._handle_quick_ping_callback,
+            "analytics": self._handle_analytics_callback,
+            "view_alerts": self._handle_alerts_callback,
+            "help_menu": self._handle_help_menu_callback,
+            "add_url_wizard": self._handle_add_url_wizard_callback,
+            "remove_url_menu": self._handle_remove_url_menu_callback,
+            "admin_panel": self._handle_admin_panel_callback,
+            # Legacy callbacks for compatibility
+            "list_urls": self._handle_main_urls_callback,
+            "ping_now": self._handle_quick_ping_callback,
+            "help_seturl": self._handle_add_url_wizard_callback,
+            "help": self._handle_help_menu_callback,
+        }
+        # Refresh buttons are debounced per message so bursts of clicks render once
+        self._refresh_callbacks = {
+            "refresh_main": self._handle_main_menu_callback,
+            "refresh_urls": self._handle_main_urls_callback,
+            "show_status": self._handle_main_stats_callback,
+        }
+        self.refresh_debounce = 0.8
+        self._pending_refresh: Dict[Tuple[int, int], asyncio.Task] = {}
+        self._prefix_callbacks = {
+            "urls_page": self._handle_urls_page_callback,
+            "test_url": self._handle_test_url_callback,
+            "url_detail": self._handle_url_detail_callback,
+            "remove_url": self._handle_remove_url_callback,
+            "confirm_remove": self._handle_confirm_remove_callback,
+        }
+        
+        # Per-chat job queues: slow work in one chat never blocks another chat,
+        # while jobs within a chat still run in order
+        self._chat_queues: Dict[int, asyncio.Queue] = {}
+        self._chat_tasks: Dict[int, asyncio.Task] = {}
+    
+    def _spawn(self, coro) -> asyncio.Task:
+        """Run a coroutine in the background, logging its failure instead of losing it"""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_done)
+        return task
+    
+    def _background_done(self, task: asyncio.Task):
+        """Drop a finished background task and log any exception it raised"""
+        self._background_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Background task failed: {task.exception()!r}")
+    
+    async def _reply(self, update: Update, *args, **kwargs):
+        """Reply to the triggering message through the per-chat throttler"""
+        return await self.throttler.send(
+            update.effective_chat.id, lambda: update.message.reply_text(*args, **kwargs)
+        )
+    
+    async def _edit_query(self, query, text: str, **kwargs):
+        """Edit a callback query's message through the per-chat throttler"""
+        return await self._edit_if_changed(
+            query.message, lambda: query.edit_message_text(text, **kwargs), text, kwargs
+        )
+    
+    async def _edit_message(self, message, text: str, **kwargs):
+        """Edit a previously sent message through the per-chat throttler"""
+        return await self._edit_if_changed(
+            message, lambda: message.edit_text(text, **kwargs), text, kwargs
+        )
+    
+    async def _edit_if_changed(self, message, edit, text: str, kwargs: Dict[str, Any]):
+        """Run an edit unless the message already shows exactly this content
+        
+        Refresh buttons often re-render identical content; Telegram rejects such
+        edits with "message is not modified" and still counts them against the
+        chat's rate limit.
+        """
+        key = (message.chat.id, message.message_id)
+        content_hash = hash((text, kwargs.get("parse_mode"), repr(kwargs.get("reply_markup"))))
+        if self._last_edit.get(key) == content_hash:
+            return None
+        
+        self._last_edit[key] = content_hash
+        self._last_edit.move_to_end(key)
+        if len(self._last_edit) > self._last_edit_size:
+            self._last_edit.popitem(last=False)
+        
+        try:
+            return await self.throttler.send(message.chat.id, edit)
+        except Exception:
+            # The message keeps its old content, so a retry must not be skipped
+            self._last_edit.pop(key, None)
+            raise
+    
+    async def _enqueue(self, chat_id: int, fn, *args):
+        """Queue a handler body on the chat's worker and return immediately"""
+        queue = self._chat_queues.get(chat_id)
+        if queue is None:
+            queue = self._chat_queues[chat_id] = asyncio.Queue()
+        queue.put_nowait((fn, args))
+        
+        task = self._chat_tasks.get(chat_id)
+        if task is None or task.done():
+            self._chat_tasks[chat_id] = asyncio.create_task(self._chat_worker(chat_id, queue))
+    
+    async def _chat_worker(self, chat_id: int, queue: asyncio.Queue):
+        """Run queued jobs for one chat until its queue is drained"""
+        while not queue.empty():
+            fn, args = queue.get_nowait()
+            try:
+                await fn(*args)
+            except Exception:
+                logger.exception(f"Error in {fn.__name__} for chat {chat_id}")
+    
+    def _schedule_refresh(self, query, handler):
+        """Run a refresh handler once clicks on the same message have settled"""
+        key = (query.message.chat.id, query.message.message_id)
+        if key in self._pending_refresh:
+            return
+        self._pending_refresh[key] = asyncio.create_task(self._refresh_after(key, query, handler))
+    
+    async def _refresh_after(self, key: Tuple[int, int], query, handler):
+        """Wait out the debounce window, then queue the refresh on the chat's worker"""
+        try:
+            await asyncio.sleep(self.refresh_debounce)
+        finally:
+            self._pending_refresh.pop(key, None)
+        await self._enqueue(key[0], handler, query)
     
     def _is_admin(self, update: Update) -> bool:
         """Check if the user is an admin"""
@@ -29,13 +473,42 @@ class BotHandlers:
             return False
         return self.config.is_admin(update.effective_chat.id)
     
+    def _parse_url_id(self, arg: str) -> Optional[int]:
+        """Parse the stable URL id from the argument of callback data like "test_url:42"
+        
+        Ids come from DataManager, are persisted with each URL record and never
+        reused, so buttons keep working across restarts. Malformed data from
+        old keyboards yields None and is reported as "URL not found".
+        """
+        try:
+            return int(arg)
+        except ValueError:
+            return None
+    
+    def _monitoring_status_line(self, monitor_status: Dict[str, Any]) -> str:
+        """Format the "Monitoring Status" footer line of status messages"""
+        if monitor_status["is_running"]:
+            return "\n<b>Monitoring Status:</b> 🟢 Active\n"
+        return "\n<b>Monitoring Status:</b> 🔴 Inactive\n"
+    
+    def _format_ping_results(self, results: Dict[str, Dict[str, Any]]) -> str:
+        """Format manual ping results for /pingnow and its button"""
+        parts = ["🔄 <b>Manual Ping Results</b>\n\n"]
+        
+        for url, result in results.items():
+            status_icon, status_text = PING_STATUS[bool(result["success"])]
+            parts.append(
+                f"{status_icon} <b>{status_text}</b>\n"
+                f"   <code>{self.url_monitor.url_html(url)}</code>\n"
+                f"   Status: {result['status_code']} | Time: {result['response_time']:.3f}s\n\n"
+            )
+        
+        parts.append(f"<b>Completed:</b> {time.strftime('%H:%M:%S')}")
+        return "".join(parts)
+    
     async def _send_admin_only_message(self, update: Update):
         """Send admin-only access message"""
-        await update.message.reply_text(
-            "🔒 Access Denied\n\n"
-            "This bot is restricted to admin use only.\n"
-            "Please contact the administrator for access."
-        )
+        await self._reply(update, ADMIN_DENIED_MSG)
     
     async def start_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /start command"""
@@ -43,29 +516,15 @@ class BotHandlers:
             await self._send_admin_only_message(update)
             return
         
-        # Show typing animation for better UX
-        await self.advanced_ui.show_typing_animation(update.effective_chat.id, context.bot, 2)
-        
-        welcome_msg = (
-            "🚀 **Advanced URL Monitor Bot** 🚀\n\n"
-            "Welcome to the next-generation URL monitoring system!\n\n"
-            "✨ **New Features:**\n"
-            "🎯 Smart Dashboard with Real-time Analytics\n"
-            "⚡ Lightning-fast Response Time Tracking\n"
-            "🔔 Intelligent Alert System\n"
-            "📊 Advanced Statistics & Trends\n"
-            "🎨 Modern Interactive Interface\n\n"
-            "🤖 **AI-Powered Monitoring:**\n"
-            "I automatically ping your URLs every 60 seconds using advanced algorithms and alert you instantly when issues are detected!\n\n"
-            "Choose an option below to get started:"
-        )
+        # Show typing indicator in the background; the welcome message doesn't wait for it
+        self._spawn(self.advanced_ui.show_typing_animation(update.effective_chat.id, context.bot, 2))
         
         # Use advanced main menu
         reply_markup = self.advanced_ui.create_main_menu_keyboard()
         
-        await update.message.reply_text(
-            welcome_msg,
-            parse_mode='Markdown',
+        await self._reply(update,
+            WELCOME_MSG,
+            parse_mode=ParseMode.HTML,
             reply_markup=reply_markup
         )
     
@@ -78,74 +537,28 @@ class BotHandlers:
         # Check if user is primary admin to show admin commands
         is_primary = self.config.is_primary_admin(update.effective_chat.id)
         
-        help_msg = (
-            "🆘 **Advanced Help System** 🆘\n\n"
-            "🚀 **URL Monitoring Commands:**\n"
-            "📌 `/seturl <url>` - Add URL with smart validation\n"
-            "🗑️ `/removeurl <url>` - Remove URL with confirmation\n"
-            "📋 `/listurls` - Interactive URL dashboard\n"
-            "📊 `/status` - Advanced analytics dashboard\n"
-            "🔄 `/pingnow` - Instant ping with progress animation\n\n"
-        )
-        
-        if is_primary:
-            help_msg += (
-                "👥 **Admin Management Commands:**\n"
-                "➕ `/addadmin <chat_id>` - Add new admin user\n"
-                "➖ `/removeadmin <chat_id>` - Remove admin access\n"
-                "📋 `/listadmins` - View all administrators\n\n"
-            )
-        
-        help_msg += (
-            "✨ **Advanced Features:**\n"
-            "🎯 Smart Dashboard with Real-time Updates\n"
-            "📈 Trend Analysis & Performance Insights\n"
-            "🔔 Intelligent Alert System\n"
-            "⚡ Sub-second Response Time Tracking\n"
-            "📱 Mobile-Optimized Interface\n"
-            "🎨 Interactive Buttons & Animations\n"
-            "💾 Persistent Data with Auto-Recovery\n\n"
-            "🎨 **Status Indicators:**\n"
-            "🟢 Online - Excellent Performance\n"
-            "🟡 Warning - Slower Response\n"
-            "🔴 Offline - Service Down\n"
-            "⏳ Pending - Initial Check\n\n"
-            "💡 **Pro Tips:**\n"
-            "• Use interactive buttons for faster navigation\n"
-            "• Check the dashboard for detailed insights\n"
-            "• Set up multiple URLs for comprehensive monitoring"
-        )
-        
-        if is_primary:
-            help_msg += "\n• Use Admin Panel to manage multiple users"
-        
-        keyboard = [
-            [
-                InlineKeyboardButton("🚀 Dashboard", callback_data="main_menu"),
-                InlineKeyboardButton("📊 Quick Stats", callback_data="main_stats")
-            ],
-            [
-                InlineKeyboardButton("➕ Add URL", callback_data="add_url_wizard"),
-                InlineKeyboardButton("⚙️ Settings", callback_data="main_settings")
-            ]
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
+        help_msg = PRIMARY_HELP_MSG if is_primary else HELP_MSG
         
-        await update.message.reply_text(help_msg, parse_mode='Markdown', reply_markup=reply_markup)
+        await self._reply(update, help_msg, parse_mode=ParseMode.HTML, reply_markup=HELP_KEYBOARD)
     
     async def set_url_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /seturl command"""
+        """Handle /seturl command on the chat's worker queue"""
+        await self._enqueue(update.effective_chat.id, self._do_set_url, update, context)
+    
+    async def _do_set_url(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Run /seturl command"""
+        chat_id = str(update.effective_chat.id)
         if not self._is_admin(update):
             await self._send_admin_only_message(update)
             return
         
         # Check if URL is provided
         if not context.args:
-            await update.message.reply_text(
+            await self._reply(update,
                 "❌ Please provide a URL to monitor.\n\n"
-                "Usage: `/seturl <url>`\n"
-                "Example: `/seturl https://myapp.herokuapp.com`",
-                parse_mode='Markdown'
+                "Usage: <code>/seturl &lt;url&gt;</code>\n"
+                "Example: <code>/seturl https://myapp.herokuapp.com</code>",
+                parse_mode=ParseMode.HTML
             )
             return
         
@@ -153,70 +566,72 @@ class BotHandlers:
         
         # Validate URL
         if not validate_url(url):
-            await update.message.reply_text(
+            await self._reply(update,
                 "❌ Invalid URL format.\n\n"
                 "Please provide a valid URL starting with http:// or https://\n"
-                "Example: `https://myapp.herokuapp.com`",
-                parse_mode='Markdown'
+                "Example: <code>https://myapp.herokuapp.com</code>",
+                parse_mode=ParseMode.HTML
             )
             return
         
-        # Show processing animation
-        processing_msg = await update.message.reply_text(
-            "🔄 **Processing URL...**\n\n"
-            "⏳ Validating URL format\n"
-            "⏳ Testing connectivity\n"
-            "⏳ Adding to monitoring system",
-            parse_mode='Markdown'
-        )
-        
-        # Add URL to monitoring
-        success = self.url_monitor.add_url(url, str(update.effective_chat.id))
+        # Add URL to monitoring; the processing placeholder is only shown
+        # when the add is slow, so the fast path costs a single message
+        add_task = asyncio.ensure_future(self.url_monitor.aadd_url(url, chat_id))
+        processing_msg = None
+        try:
+            success = await asyncio.wait_for(asyncio.shield(add_task), timeout=self.placeholder_delay)
+        except asyncio.TimeoutError:
+            processing_msg = await self._reply(update,
+                "🔄 <b>Processing URL...</b>\n\n"
+                "⏳ Validating URL format\n"
+                "⏳ Testing connectivity\n"
+                "⏳ Adding to monitoring system",
+                parse_mode=ParseMode.HTML
+            )
+            success = await add_task
         
         if success:
-            # Store URL hash mapping for callbacks
-            url_hash = hash(url) % 10000
-            self.url_hash_map[url_hash] = url
+            # Stable id used to reference this URL in callbacks
+            url_id = self.url_monitor.get_url_id(url, chat_id)
+            # Display the stored, normalized key rather than the raw argument
+            url = self.url_monitor.get_url_by_id(url_id, chat_id)
             
-            # Create enhanced response with animations
-            keyboard = [
-                [
-                    InlineKeyboardButton("📊 View Dashboard", callback_data="main_urls"),
-                    InlineKeyboardButton("⚡ Test Now", callback_data=f"test_url:{url_hash}")
-                ],
+            # Create enhanced response; only the "Test Now" button is URL specific
+            reply_markup = InlineKeyboardMarkup([
                 [
-                    InlineKeyboardButton("📈 View Stats", callback_data="main_stats"),
-                    InlineKeyboardButton("🔄 Ping All", callback_data="quick_ping")
+                    self._btn_view_dashboard,
+                    InlineKeyboardButton("⚡ Test Now", callback_data=f"test_url:{url_id}")
                 ],
-                [
-                    InlineKeyboardButton("🏠 Main Menu", callback_data="main_menu")
-                ]
-            ]
-            reply_markup = InlineKeyboardMarkup(keyboard)
+                *self._kb_after_add_rows
+            ])
             
-            await processing_msg.edit_text(
-                f"✅ **URL Successfully Added!** 🎉\n\n"
-                f"🌐 **URL:** `{url}`\n"
-                f"🎯 **Status:** Active Monitoring\n"
-                f"⏰ **Ping Interval:** Every 60 seconds\n"
-                f"🔔 **Alerts:** Instant notifications enabled\n"
-                f"📊 **Analytics:** Real-time tracking started\n\n"
-                f"🚀 **Next Steps:**\n"
+            message = (
+                f"✅ <b>URL Successfully Added!</b> 🎉\n\n"
+                f"🌐 <b>URL:</b> <code>{self.url_monitor.url_html(url)}</code>\n"
+                f"🎯 <b>Status:</b> Active Monitoring\n"
+                f"⏰ <b>Ping Interval:</b> Every 60 seconds\n"
+                f"🔔 <b>Alerts:</b> Instant notifications enabled\n"
+                f"📊 <b>Analytics:</b> Real-time tracking started\n\n"
+                f"🚀 <b>Next Steps:</b>\n"
                 f"• View the dashboard for real-time status\n"
                 f"• Test connectivity immediately\n"
-                f"• Monitor performance analytics",
-                parse_mode='Markdown',
-                reply_markup=reply_markup
+                f"• Monitor performance analytics"
             )
         else:
-            await update.message.reply_text(
-                f"❌ Failed to add URL: `{url}`\n\n"
-                "Please try again or check the URL format.",
-                parse_mode='Markdown'
+            reply_markup = None
+            message = (
+                f"❌ Failed to add URL: <code>{html.escape(url)}</code>\n\n"
+                "Please try again or check the URL format."
             )
+        
+        if processing_msg is None:
+            await self._reply(update, message, parse_mode=ParseMode.HTML, reply_markup=reply_markup)
+        else:
+            await self._edit_message(processing_msg, message, parse_mode=ParseMode.HTML, reply_markup=reply_markup)
     
     async def remove_url_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /removeurl command"""
+        chat_id = str(update.effective_chat.id)
         if not self._is_admin(update):
             await self._send_admin_only_message(update)
             return
@@ -224,71 +639,66 @@ class BotHandlers:
         # Check if URL is provided
         if not context.args:
             # Show current URLs for easy removal
-            urls = self.url_monitor.get_urls(str(update.effective_chat.id))
+            urls = self.url_monitor.get_urls(chat_id)
             if not urls:
-                await update.message.reply_text(
+                await self._reply(update,
                     "❌ No URLs are currently being monitored.\n\n"
-                    "Use `/seturl <url>` to add URLs to monitor.",
-                    parse_mode='Markdown'
+                    "Use <code>/seturl &lt;url&gt;</code> to add URLs to monitor.",
+                    parse_mode=ParseMode.HTML
                 )
                 return
             
-            url_list = "\n".join([f"• `{url}`" for url in urls.keys()])
-            await update.message.reply_text(
+            url_list = "\n".join([f"• <code>{self.url_monitor.url_html(url)}</code>" for url in urls.keys()])
+            await self._reply(update,
                 "❌ Please specify which URL to remove.\n\n"
-                "**Current URLs:**\n"
+                "<b>Current URLs:</b>\n"
                 f"{url_list}\n\n"
-                "Usage: `/removeurl <url>`",
-                parse_mode='Markdown'
+                "Usage: <code>/removeurl &lt;url&gt;</code>",
+                parse_mode=ParseMode.HTML
             )
             return
         
         url = context.args[0]
         
         # Remove URL from monitoring
-        success = self.url_monitor.remove_url(url, str(update.effective_chat.id))
+        success = await self.url_monitor.aremove_url(url, chat_id)
         
         if success:
-            keyboard = [
-                [InlineKeyboardButton("📋 List Remaining URLs", callback_data="list_urls")]
-            ]
-            reply_markup = InlineKeyboardMarkup(keyboard)
+            reply_markup = self._kb_after_remove
             
-            await update.message.reply_text(
-                f"✅ **URL Removed Successfully!**\n\n"
-                f"**URL:** `{url}`\n"
-                f"**Status:** No longer monitoring\n\n"
+            await self._reply(update,
+                f"✅ <b>URL Removed Successfully!</b>\n\n"
+                f"<b>URL:</b> <code>{html.escape(url)}</code>\n"
+                f"<b>Status:</b> No longer monitoring\n\n"
                 f"This URL will no longer receive keep-alive pings.",
-                parse_mode='Markdown',
+                parse_mode=ParseMode.HTML,
                 reply_markup=reply_markup
             )
         else:
-            await update.message.reply_text(
-                f"❌ URL not found: `{url}`\n\n"
+            await self._reply(update,
+                f"❌ URL not found: <code>{html.escape(url)}</code>\n\n"
                 "This URL is not currently being monitored.\n"
-                "Use `/listurls` to see all monitored URLs.",
-                parse_mode='Markdown'
+                "Use <code>/listurls</code> to see all monitored URLs.",
+                parse_mode=ParseMode.HTML
             )
     
     async def list_urls_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /listurls command"""
+        chat_id = str(update.effective_chat.id)
         if not self._is_admin(update):
             await self._send_admin_only_message(update)
             return
         
-        urls = self.url_monitor.get_urls(str(update.effective_chat.id))
+        urls = self.url_monitor.get_urls(chat_id)
         
         if not urls:
-            keyboard = [
-                [InlineKeyboardButton("➕ Add URL", callback_data="help_seturl")]
-            ]
-            reply_markup = InlineKeyboardMarkup(keyboard)
+            reply_markup = self._kb_no_urls
             
-            await update.message.reply_text(
-                "📭 **No URLs Currently Monitored**\n\n"
+            await self._reply(update,
+                "📭 <b>No URLs Currently Monitored</b>\n\n"
                 "You haven't added any URLs to monitor yet.\n\n"
-                "Use `/seturl <url>` to start monitoring a URL.",
-                parse_mode='Markdown',
+                "Use <code>/seturl &lt;url&gt;</code> to start monitoring a URL.",
+                parse_mode=ParseMode.HTML,
                 reply_markup=reply_markup
             )
             return
@@ -296,439 +706,277 @@ class BotHandlers:
         message = format_url_list(urls)
         
         # Add action buttons
-        keyboard = [
-            [InlineKeyboardButton("📊 Show Status", callback_data="show_status")],
-            [InlineKeyboardButton("🔄 Ping Now", callback_data="ping_now")]
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
+        reply_markup = self._kb_list_urls
         
-        await update.message.reply_text(
+        await self._reply(update,
             message,
-            parse_mode='Markdown',
+            parse_mode=ParseMode.HTML,
             reply_markup=reply_markup
         )
     
     async def status_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /status command"""
+        """Handle /status command on the chat's worker queue"""
+        await self._enqueue(update.effective_chat.id, self._do_status, update, context)
+    
+    async def _do_status(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Run /status command"""
+        chat_id = str(update.effective_chat.id)
         if not self._is_admin(update):
             await self._send_admin_only_message(update)
             return
         
-        urls = self.url_monitor.get_urls(str(update.effective_chat.id))
+        urls = self.url_monitor.get_urls(chat_id)
         
         if not urls:
-            await update.message.reply_text(
-                "📊 **No Status Data Available**\n\n"
+            await self._reply(update,
+                "📊 <b>No Status Data Available</b>\n\n"
                 "No URLs are currently being monitored.\n"
-                "Use `/seturl <url>` to add URLs and start collecting statistics.",
-                parse_mode='Markdown'
+                "Use <code>/seturl &lt;url&gt;</code> to add URLs and start collecting statistics.",
+                parse_mode=ParseMode.HTML
             )
             return
         
-        message = "📊 **24-Hour Uptime Statistics**\n\n"
+        parts = ["📊 <b>24-Hour Uptime Statistics</b>\n\n"]
         
-        for url in urls.keys():
-            stats = self.url_monitor.get_uptime_stats(url, str(update.effective_chat.id), 24)
-            message += format_uptime_message(url, stats)
-            message += "\n"
+        all_stats = await self.url_monitor.aget_uptime_stats(urls, chat_id, 24)
+        for url, stats in zip(urls, all_stats):
+            parts.append(format_uptime_message(url, stats))
+            parts.append("\n")
         
         # Add monitoring status
-        monitor_status = self.url_monitor.get_monitoring_status()
-        status_icon = "🟢" if monitor_status["is_running"] else "🔴"
-        message += f"\n**Monitoring Status:** {status_icon} {'Active' if monitor_status['is_running'] else 'Inactive'}\n"
-        message += f"**Ping Interval:** {monitor_status['ping_interval']} seconds\n"
-        message += f"**Last Updated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        monitor_status = self.url_monitor.get_monitoring_status(chat_id)
+        parts.append(self._monitoring_status_line(monitor_status))
+        parts.append(f"<b>Ping Interval:</b> {monitor_status['ping_interval']} seconds\n")
+        parts.append(f"<b>Last Updated:</b> {time.strftime('%Y-%m-%d %H:%M:%S')}")
+        message = "".join(parts)
         
-        keyboard = [
-            [InlineKeyboardButton("🔄 Refresh Stats", callback_data="show_status")],
-            [InlineKeyboardButton("📋 List URLs", callback_data="list_urls")]
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
+        reply_markup = self._kb_status
         
-        await update.message.reply_text(
+        await self._reply(update,
             message,
-            parse_mode='Markdown',
+            parse_mode=ParseMode.HTML,
             reply_markup=reply_markup
         )
     
     async def ping_now_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /pingnow command"""
+        """Handle /pingnow command on the chat's worker queue"""
+        await self._enqueue(update.effective_chat.id, self._do_ping_now, update, context)
+    
+    async def _do_ping_now(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Run /pingnow command"""
+        chat_id = str(update.effective_chat.id)
         if not self._is_admin(update):
             await self._send_admin_only_message(update)
             return
         
-        urls = self.url_monitor.get_urls(str(update.effective_chat.id))
+        urls = self.url_monitor.get_urls(chat_id)
         
         if not urls:
-            await update.message.reply_text(
-                "❌ **No URLs to Ping**\n\n"
+            await self._reply(update,
+                "❌ <b>No URLs to Ping</b>\n\n"
                 "No URLs are currently being monitored.\n"
-                "Use `/seturl <url>` to add URLs first.",
-                parse_mode='Markdown'
+                "Use <code>/seturl &lt;url&gt;</code> to add URLs first.",
+                parse_mode=ParseMode.HTML
             )
             return
         
-        # Send initial message
-        status_msg = await update.message.reply_text(
-            f"🔄 **Pinging {len(urls)} URLs...**\n\n"
+        # Send initial message while the pings are already in flight
+        status_task = asyncio.create_task(self._reply(update,
+            f"🔄 <b>Pinging {len(urls)} URLs...</b>\n\n"
             "Please wait while I check all your URLs.",
-            parse_mode='Markdown'
-        )
+            parse_mode=ParseMode.HTML
+        ))
         
         try:
-            # Perform the pings for this admin only
-            results = await self.url_monitor.ping_admin_urls(str(update.effective_chat.id))
+            # Perform the pings for this admin only (concurrently inside the monitor)
+            results = await self.url_monitor.ping_admin_urls(chat_id)
             
             # Format results
-            message = "🔄 **Manual Ping Results**\n\n"
-            
-            for url, result in results.items():
-                status_icon = "🟢" if result["success"] else "🔴"
-                status_text = "Online" if result["success"] else "Offline"
-                
-                message += f"{status_icon} **{status_text}**\n"
-                message += f"   `{url}`\n"
-                message += f"   Status: {result['status_code']} | "
-                message += f"Time: {result['response_time']:.3f}s\n\n"
-            
-            message += f"**Completed:** {datetime.now().strftime('%H:%M:%S')}"
+            message = self._format_ping_results(results)
             
             # Add action buttons
-            keyboard = [
-                [InlineKeyboardButton("📊 Show Status", callback_data="show_status")],
-                [InlineKeyboardButton("📋 List URLs", callback_data="list_urls")]
-            ]
-            reply_markup = InlineKeyboardMarkup(keyboard)
+            reply_markup = self._kb_ping_results
             
             # Update the status message
-            await status_msg.edit_text(
+            status_msg = await status_task
+            await self._edit_message(status_msg,
                 message,
-                parse_mode='Markdown',
+                parse_mode=ParseMode.HTML,
                 reply_markup=reply_markup
             )
             
         except Exception as e:
             logger.error(f"Error in ping_now_command: {e}")
-            await status_msg.edit_text(
-                f"❌ **Ping Failed**\n\n"
-                f"An error occurred while pinging URLs: {str(e)}",
-                parse_mode='Markdown'
+            status_msg = await status_task
+            await self._edit_message(status_msg,
+                f"❌ <b>Ping Failed</b>\n\n"
+                f"An error occurred while pinging URLs: {html.escape(str(e))}",
+                parse_mode=ParseMode.HTML
             )
     
     async def add_admin_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /addadmin command - Only primary admin can add new admins"""
         if not self.config.is_primary_admin(update.effective_chat.id):
-            await update.message.reply_text(
-                "🔒 **Access Denied**\n\n"
+            await self._reply(update,
+                "🔒 <b>Access Denied</b>\n\n"
                 "Only the primary admin can add new administrators.",
-                parse_mode='Markdown'
+                parse_mode=ParseMode.HTML
             )
             return
         
         if not context.args:
-            await update.message.reply_text(
-                "❌ **Usage Error**\n\n"
-                "**Correct usage:** `/addadmin <chat_id>`\n\n"
-                "**Example:** `/addadmin 123456789`\n\n"
-                "**How to get Chat ID:**\n"
+            await self._reply(update,
+                "❌ <b>Usage Error</b>\n\n"
+                "<b>Correct usage:</b> <code>/addadmin &lt;chat_id&gt;</code>\n\n"
+                "<b>Example:</b> <code>/addadmin 123456789</code>\n\n"
+                "<b>How to get Chat ID:</b>\n"
                 "Ask the user to send a message to @userinfobot to get their chat ID.",
-                parse_mode='Markdown'
+                parse_mode=ParseMode.HTML
             )
             return
         
         try:
             new_admin_id = int(context.args[0])
         except ValueError:
-            await update.message.reply_text(
-                "❌ **Invalid Chat ID**\n\n"
+            await self._reply(update,
+                "❌ <b>Invalid Chat ID</b>\n\n"
                 "Chat ID must be a number.\n\n"
-                "Example: `/addadmin 123456789`",
-                parse_mode='Markdown'
+                "Example: <code>/addadmin 123456789</code>",
+                parse_mode=ParseMode.HTML
             )
             return
         
         if self.config.add_admin(new_admin_id):
-            await update.message.reply_text(
-                f"✅ **Admin Added Successfully!**\n\n"
-                f"**New Admin ID:** `{new_admin_id}`\n"
-                f"**Total Admins:** {len(self.config.get_admin_list())}\n\n"
+            await self._reply(update,
+                f"✅ <b>Admin Added Successfully!</b>\n\n"
+                f"<b>New Admin ID:</b> <code>{new_admin_id}</code>\n"
+                f"<b>Total Admins:</b> {len(self.config.get_admin_list())}\n\n"
                 f"This user can now use all bot features.",
-                parse_mode='Markdown'
+                parse_mode=ParseMode.HTML
             )
         else:
-            await update.message.reply_text(
-                f"ℹ️ **Admin Already Exists**\n\n"
-                f"Chat ID `{new_admin_id}` is already an admin.",
-                parse_mode='Markdown'
+            await self._reply(update,
+                f"ℹ️ <b>Admin Already Exists</b>\n\n"
+                f"Chat ID <code>{new_admin_id}</code> is already an admin.",
+                parse_mode=ParseMode.HTML
             )
     
     async def remove_admin_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /removeadmin command - Only primary admin can remove admins"""
         if not self.config.is_primary_admin(update.effective_chat.id):
-            await update.message.reply_text(
-                "🔒 **Access Denied**\n\n"
+            await self._reply(update,
+                "🔒 <b>Access Denied</b>\n\n"
                 "Only the primary admin can remove administrators.",
-                parse_mode='Markdown'
+                parse_mode=ParseMode.HTML
             )
             return
         
         if not context.args:
-            await update.message.reply_text(
-                "❌ **Usage Error**\n\n"
-                "**Correct usage:** `/removeadmin <chat_id>`\n\n"
-                "**Example:** `/removeadmin 123456789`\n\n"
-                "Use `/listadmins` to see all current admins.",
-                parse_mode='Markdown'
+            await self._reply(update,
+                "❌ <b>Usage Error</b>\n\n"
+                "<b>Correct usage:</b> <code>/removeadmin &lt;chat_id&gt;</code>\n\n"
+                "<b>Example:</b> <code>/removeadmin 123456789</code>\n\n"
+                "Use <code>/listadmins</code> to see all current admins.",
+                parse_mode=ParseMode.HTML
             )
             return
         
         try:
             admin_id = int(context.args[0])
         except ValueError:
-            await update.message.reply_text(
-                "❌ **Invalid Chat ID**\n\n"
+            await self._reply(update,
+                "❌ <b>Invalid Chat ID</b>\n\n"
                 "Chat ID must be a number.",
-                parse_mode='Markdown'
+                parse_mode=ParseMode.HTML
             )
             return
         
         if self.config.remove_admin(admin_id):
-            await update.message.reply_text(
-                f"✅ **Admin Removed Successfully!**\n\n"
-                f"**Removed Admin ID:** `{admin_id}`\n"
-                f"**Remaining Admins:** {len(self.config.get_admin_list())}\n\n"
+            await self._reply(update,
+                f"✅ <b>Admin Removed Successfully!</b>\n\n"
+                f"<b>Removed Admin ID:</b> <code>{admin_id}</code>\n"
+                f"<b>Remaining Admins:</b> {len(self.config.get_admin_list())}\n\n"
                 f"This user can no longer use bot features.",
-                parse_mode='Markdown'
+                parse_mode=ParseMode.HTML
             )
         else:
             if admin_id == self.config.primary_admin_chat_id:
-                await update.message.reply_text(
-                    "❌ **Cannot Remove Primary Admin**\n\n"
+                await self._reply(update,
+                    "❌ <b>Cannot Remove Primary Admin</b>\n\n"
                     "The primary admin cannot be removed for security reasons.",
-                    parse_mode='Markdown'
+                    parse_mode=ParseMode.HTML
                 )
             else:
-                await update.message.reply_text(
-                    f"❌ **Admin Not Found**\n\n"
-                    f"Chat ID `{admin_id}` is not currently an admin.",
-                    parse_mode='Markdown'
+                await self._reply(update,
+                    f"❌ <b>Admin Not Found</b>\n\n"
+                    f"Chat ID <code>{admin_id}</code> is not currently an admin.",
+                    parse_mode=ParseMode.HTML
                 )
     
     async def list_admins_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /listadmins command - Only primary admin can view admin list"""
         if not self.config.is_primary_admin(update.effective_chat.id):
-            await update.message.reply_text(
-                "🔒 **Access Denied**\n\n"
+            await self._reply(update,
+                "🔒 <b>Access Denied</b>\n\n"
                 "Only the primary admin can view the admin list.",
-                parse_mode='Markdown'
+                parse_mode=ParseMode.HTML
             )
             return
         
         admin_list = self.config.get_admin_list()
         
-        message = "👥 **Admin Management Panel**\n\n"
-        message += f"**Total Admins:** {len(admin_list)}\n\n"
+        message = "👥 <b>Admin Management Panel</b>\n\n"
+        message += f"<b>Total Admins:</b> {len(admin_list)}\n\n"
         
         for i, admin_id in enumerate(admin_list, 1):
             if admin_id == self.config.primary_admin_chat_id:
-                message += f"**{i}.** `{admin_id}` 👑 **Primary Admin**\n"
+                message += f"<b>{i}.</b> <code>{admin_id}</code> 👑 <b>Primary Admin</b>\n"
             else:
-                message += f"**{i}.** `{admin_id}`\n"
+                message += f"<b>{i}.</b> <code>{admin_id}</code>\n"
         
-        message += f"\n**Commands:**\n"
-        message += f"• `/addadmin <chat_id>` - Add new admin\n"
-        message += f"• `/removeadmin <chat_id>` - Remove admin\n"
-        message += f"• `/listadmins` - Show this list\n\n"
-        message += f"**Note:** Only primary admin can manage other admins."
+        message += f"\n<b>Commands:</b>\n"
+        message += f"• <code>/addadmin &lt;chat_id&gt;</code> - Add new admin\n"
+        message += f"• <code>/removeadmin &lt;chat_id&gt;</code> - Remove admin\n"
+        message += f"• <code>/listadmins</code> - Show this list\n\n"
+        message += f"<b>Note:</b> Only primary admin can manage other admins."
         
-        await update.message.reply_text(message, parse_mode='Markdown')
+        await self._reply(update, message, parse_mode=ParseMode.HTML)
     
     async def button_callback(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle inline button callbacks"""
         query = update.callback_query
-        await query.answer()
         
+        # Denied presses get a single alert instead of an answer plus an edit
         if not self._is_admin(update):
-            await query.edit_message_text("🔒 Access denied. Admin only.")
+            await query.answer(ADMIN_DENIED_ALERT, show_alert=True)
             return
         
         callback_data = query.data
         
-        # Handle advanced UI callbacks
-        if callback_data == "main_menu":
-            await self._handle_main_menu_callback(query)
-        elif callback_data == "main_urls":
-            await self._handle_main_urls_callback(query)
-        elif callback_data == "main_stats":
-            await self._handle_main_stats_callback(query)
-        elif callback_data == "main_settings":
-            await self._handle_settings_callback(query)
-        elif callback_data == "quick_ping":
-            await self._handle_quick_ping_callback(query)
-        elif callback_data == "analytics":
-            await self._handle_analytics_callback(query)
-        elif callback_data == "view_alerts":
-            await self._handle_alerts_callback(query)
-        elif callback_data == "help_menu":
-            await self._handle_help_menu_callback(query)
-        elif callback_data == "refresh_main":
-            await self._handle_main_menu_callback(query)
-        elif callback_data.startswith("urls_page:"):
-            page = int(callback_data.split(":")[1])
-            await self._handle_urls_page_callback(query, page)
-        elif callback_data.startswith("test_url:"):
-            url_hash = int(callback_data.split(":")[1])
-            await self._handle_test_url_callback(query, url_hash)
-        elif callback_data.startswith("url_detail:"):
-            url_hash = int(callback_data.split(":")[1])
-            await self._handle_url_detail_callback(query, url_hash)
-        elif callback_data.startswith("remove_url:"):
-            url_hash = int(callback_data.split(":")[1])
-            await self._handle_remove_url_callback(query, url_hash)
-        elif callback_data.startswith("confirm_remove:"):
-            url_hash = int(callback_data.split(":")[1])
-            await self._handle_confirm_remove_callback(query, url_hash)
-        elif callback_data == "add_url_wizard":
-            await self._handle_add_url_wizard_callback(query)
-        elif callback_data == "remove_url_menu":
-            await self._handle_remove_url_menu_callback(query)
-        elif callback_data == "admin_panel":
-            await self._handle_admin_panel_callback(query)
-        # Legacy callbacks for compatibility
-        elif callback_data == "list_urls":
-            await self._handle_main_urls_callback(query)
-        elif callback_data == "show_status":
-            await self._handle_main_stats_callback(query)
-        elif callback_data == "ping_now":
-            await self._handle_quick_ping_callback(query)
-        elif callback_data == "help_seturl":
-            await self._handle_add_url_wizard_callback(query)
-    
-    async def _handle_list_urls_callback(self, query):
-        """Handle list URLs button callback"""
-        urls = self.url_monitor.get_urls(str(query.message.chat.id))
-        
-        if not urls:
-            keyboard = [
-                [InlineKeyboardButton("➕ Add URL", callback_data="help_seturl")]
-            ]
-            reply_markup = InlineKeyboardMarkup(keyboard)
-            
-            await query.edit_message_text(
-                "📭 **No URLs Currently Monitored**\n\n"
-                "You haven't added any URLs to monitor yet.\n\n"
-                "Use `/seturl <url>` to start monitoring a URL.",
-                parse_mode='Markdown',
-                reply_markup=reply_markup
-            )
+        refresh = self._refresh_callbacks.get(callback_data)
+        if refresh is not None:
+            await query.answer("🔄 Refreshing...")
+            self._schedule_refresh(query, refresh)
             return
         
-        message = format_url_list(urls)
+        # Parameterised callbacks like "test_url:42" get the raw text after the colon
+        key, _, arg = callback_data.partition(":")
         
-        keyboard = [
-            [InlineKeyboardButton("📊 Show Status", callback_data="show_status")],
-            [InlineKeyboardButton("🔄 Ping Now", callback_data="ping_now")]
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
+        # Answer before any work so the button spinner stops right away;
+        # slow actions get a toast in place of an interim "working..." edit
+        await query.answer(CALLBACK_TOASTS.get(key))
         
-        await query.edit_message_text(
-            message,
-            parse_mode='Markdown',
-            reply_markup=reply_markup
-        )
-    
-    async def _handle_show_status_callback(self, query):
-        """Handle show status button callback"""
-        urls = self.url_monitor.get_urls(str(query.message.chat.id))
-        
-        if not urls:
-            await query.edit_message_text(
-                "📊 **No Status Data Available**\n\n"
-                "No URLs are currently being monitored.",
-                parse_mode='Markdown'
-            )
+        # Handlers run on the chat's worker queue so a slow ping in one chat
+        # never delays button presses in another
+        chat_id = query.message.chat.id
+        handler = self._exact_callbacks.get(callback_data)
+        if handler is not None:
+            await self._enqueue(chat_id, handler, query)
             return
         
-        message = "📊 **24-Hour Uptime Statistics**\n\n"
-        
-        for url in urls.keys():
-            stats = self.url_monitor.get_uptime_stats(url, str(update.effective_chat.id), 24)
-            message += format_uptime_message(url, stats)
-            message += "\n"
-        
-        monitor_status = self.url_monitor.get_monitoring_status()
-        status_icon = "🟢" if monitor_status["is_running"] else "🔴"
-        message += f"\n**Monitoring Status:** {status_icon} {'Active' if monitor_status['is_running'] else 'Inactive'}\n"
-        message += f"**Last Updated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-        
-        keyboard = [
-            [InlineKeyboardButton("🔄 Refresh", callback_data="show_status")],
-            [InlineKeyboardButton("📋 List URLs", callback_data="list_urls")]
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
-        
-        await query.edit_message_text(
-            message,
-            parse_mode='Markdown',
-            reply_markup=reply_markup
-        )
-    
-    async def _handle_ping_now_callback(self, query):
-        """Handle ping now button callback"""
-        urls = self.url_monitor.get_urls(str(query.message.chat.id))
-        
-        if not urls:
-            await query.edit_message_text(
-                "❌ **No URLs to Ping**\n\n"
-                "No URLs are currently being monitored.",
-                parse_mode='Markdown'
-            )
-            return
-        
-        # Update message to show pinging status
-        await query.edit_message_text(
-            f"🔄 **Pinging {len(urls)} URLs...**\n\n"
-            "Please wait while I check all your URLs.",
-            parse_mode='Markdown'
-        )
-        
-        try:
-            # Perform the pings for this admin only
-            results = await self.url_monitor.ping_admin_urls(str(query.message.chat.id))
-            
-            # Format results
-            message = "🔄 **Manual Ping Results**\n\n"
-            
-            for url, result in results.items():
-                status_icon = "🟢" if result["success"] else "🔴"
-                status_text = "Online" if result["success"] else "Offline"
-                
-                message += f"{status_icon} **{status_text}**\n"
-                message += f"   `{url}`\n"
-                message += f"   Status: {result['status_code']} | "
-                message += f"Time: {result['response_time']:.3f}s\n\n"
-            
-            message += f"**Completed:** {datetime.now().strftime('%H:%M:%S')}"
-            
-            keyboard = [
-                [InlineKeyboardButton("📊 Show Status", callback_data="show_status")],
-                [InlineKeyboardButton("📋 List URLs", callback_data="list_urls")]
-            ]
-            reply_markup = InlineKeyboardMarkup(keyboard)
-            
-            await query.edit_message_text(
-                message,
-                parse_mode='Markdown',
-                reply_markup=reply_markup
-            )
-            
-        except Exception as e:
-            logger.error(f"Error in ping now callback: {e}")
-            await query.edit_message_text(
-                f"❌ **Ping Failed**\n\n"
-                f"An error occurred while pinging URLs: {str(e)}",
-                parse_mode='Markdown'
-            )
+        handler = self._prefix_callbacks.get(key)
+        if handler is not None:
+            await self._enqueue(chat_id, handler, query, arg)
     
     async def handle_message(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle non-command messages"""
@@ -737,118 +985,127 @@ class BotHandlers:
             return
         
         # Provide helpful response for non-command messages
-        keyboard = [
-            [InlineKeyboardButton("📋 List URLs", callback_data="list_urls")],
-            [InlineKeyboardButton("📊 Show Status", callback_data="show_status")],
-            [InlineKeyboardButton("🆘 Help", callback_data="help")]
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
+        reply_markup = self._kb_fallback
         
-        await update.message.reply_text(
-            "🤖 **AI Assistant Active**\n\n"
+        await self._reply(update,
+            "🤖 <b>AI Assistant Active</b>\n\n"
             "I didn't quite understand that message, but I'm here to help!\n\n"
-            "🚀 **Quick Actions:**",
+            "🚀 <b>Quick Actions:</b>",
+            parse_mode=ParseMode.HTML,
             reply_markup=reply_markup
         )
     
     # Advanced UI callback handlers
     async def _handle_main_menu_callback(self, query):
         """Handle main menu callback with advanced UI"""
-        welcome_msg = (
-            "🚀 **Advanced URL Monitor Dashboard** 🚀\n\n"
-            "🎯 **System Status:** ⚡ Active\n"
-            "📊 **Real-time Monitoring:** Enabled\n"
-            "🔔 **Smart Alerts:** Ready\n\n"
-            "Choose an action below to continue:"
-        )
-        
         reply_markup = self.advanced_ui.create_main_menu_keyboard()
         
-        await query.edit_message_text(
-            welcome_msg,
-            parse_mode='Markdown',
+        await self._edit_query(query,
+            MAIN_MENU_MSG,
+            parse_mode=ParseMode.HTML,
             reply_markup=reply_markup
         )
     
     async def _handle_main_urls_callback(self, query):
         """Handle URLs dashboard callback"""
-        urls = self.url_monitor.get_urls(str(query.message.chat.id))
+        chat_id = str(query.message.chat.id)
+        urls = self.url_monitor.get_urls(chat_id)
         message, reply_markup = self.advanced_ui.format_enhanced_url_list(urls)
         
-        await query.edit_message_text(
+        await self._edit_query(query,
             message,
-            parse_mode='Markdown',
+            parse_mode=ParseMode.HTML,
             reply_markup=reply_markup
         )
     
     async def _handle_main_stats_callback(self, query):
         """Handle statistics dashboard callback"""
-        urls = self.url_monitor.get_urls(str(query.message.chat.id))
+        chat_id = str(query.message.chat.id)
+        urls = self.url_monitor.get_urls(chat_id)
         message, reply_markup = self.advanced_ui.format_advanced_stats(urls)
         
-        await query.edit_message_text(
+        await self._edit_query(query,
             message,
-            parse_mode='Markdown',
+            parse_mode=ParseMode.HTML,
             reply_markup=reply_markup
         )
     
     async def _handle_settings_callback(self, query):
         """Handle settings menu callback"""
-        settings_msg = (
-            "⚙️ **Advanced Settings Panel** ⚙️\n\n"
-            "🎨 **Customize Your Experience:**\n"
-            "Configure monitoring intervals, notification preferences,\n"
-            "and advanced features to suit your needs.\n\n"
-            "Choose a setting category:"
-        )
-        
         reply_markup = self.advanced_ui.create_settings_keyboard()
         
-        await query.edit_message_text(
-            settings_msg,
-            parse_mode='Markdown',
+        await self._edit_query(query,
+            SETTINGS_MSG,
+            parse_mode=ParseMode.HTML,
             reply_markup=reply_markup
         )
     
     async def _handle_quick_ping_callback(self, query):
         """Handle quick ping with advanced animation"""
-        urls = self.url_monitor.get_urls(str(query.message.chat.id))
+        chat_id = str(query.message.chat.id)
+        urls = self.url_monitor.get_urls(chat_id)
         
         if not urls:
-            await query.edit_message_text(
-                "❌ **No URLs to Ping**\n\n"
+            await self._edit_query(query,
+                "❌ <b>No URLs to Ping</b>\n\n"
                 "No URLs are currently being monitored.\n"
                 "Add some URLs first to use this feature.",
-                parse_mode='Markdown'
+                parse_mode=ParseMode.HTML
             )
             return
         
-        # Show enhanced loading animation
-        await query.edit_message_text(
-            f"🚀 **Initiating Advanced Ping Sequence** 🚀\n\n"
-            f"⚡ Preparing to ping {len(urls)} URLs...\n"
-            f"🎯 Using optimized parallel processing\n"
-            f"📊 Real-time analysis enabled\n\n"
-            f"⏳ Please wait...",
-            parse_mode='Markdown'
-        )
+        loop = asyncio.get_running_loop()
+        edits = []
+        last_edit = 0.0
+        next_step = 1
         
-        # Simulate progress updates
-        await asyncio.sleep(1)
-        await query.edit_message_text(
-            f"🔄 **Processing URLs** 🔄\n\n"
-            f"▰▰▱▱▱ 40% Complete\n"
-            f"🎯 Testing connectivity...\n"
-            f"📡 Measuring response times...",
-            parse_mode='Markdown'
-        )
+        def on_progress(done: int, total: int):
+            """Show real progress at 25% steps, at most one edit per 500ms"""
+            nonlocal last_edit, next_step
+            # Progress only replaces a loading message that is already on screen
+            if not edits:
+                return
+            step = done * 4 // total
+            now = loop.time()
+            if done == total or step < next_step or now - last_edit < 0.5:
+                return
+            last_edit = now
+            next_step = step + 1
+            filled = done * 5 // total
+            edits.append(asyncio.create_task(self._edit_query(query,
+                f"🔄 <b>Processing URLs</b> 🔄\n\n"
+                f"{'▰' * filled}{'▱' * (5 - filled)} {done * 100 // total}% Complete\n"
+                f"🎯 Testing connectivity...\n"
+                f"📡 Measuring response times...",
+                parse_mode=ParseMode.HTML
+            )))
+        
+        # Perform the pings for this admin only
+        ping_task = asyncio.create_task(self.url_monitor.ping_admin_urls(chat_id, on_progress))
         
         try:
-            # Perform the pings for this admin only
-            results = await self.url_monitor.ping_admin_urls(str(query.message.chat.id))
+            # Small batches usually finish quickly, so they only get a loading
+            # message if they outlast the placeholder delay
+            delay = self.quick_ping_placeholder_delay if len(urls) <= 5 else 0
+            try:
+                results = await asyncio.wait_for(asyncio.shield(ping_task), timeout=delay)
+            except asyncio.TimeoutError:
+                last_edit = loop.time()
+                edits.append(asyncio.create_task(self._edit_query(query,
+                    f"🚀 <b>Initiating Advanced Ping Sequence</b> 🚀\n\n"
+                    f"⚡ Preparing to ping {len(urls)} URLs...\n"
+                    f"🎯 Using optimized parallel processing\n"
+                    f"📊 Real-time analysis enabled\n\n"
+                    f"⏳ Please wait...",
+                    parse_mode=ParseMode.HTML
+                )))
+                results = await ping_task
+            
+            # Loading/progress edits must land before the results replace them
+            await asyncio.gather(*edits, return_exceptions=True)
             
             # Enhanced results display
-            message = "⚡ **Advanced Ping Results** ⚡\n\n"
+            parts = ["⚡ <b>Advanced Ping Results</b> ⚡\n\n"]
             
             online_count = 0
             total_response_time = 0
@@ -859,410 +1116,279 @@ class BotHandlers:
                     total_response_time += result["response_time"]
                     status_icon = "🟢"
                     status_text = "ONLINE"
-                    if result["response_time"] < 1.0:
-                        speed_text = "⚡ Lightning"
-                    elif result["response_time"] < 3.0:
-                        speed_text = "🟡 Good"
-                    else:
-                        speed_text = "🔴 Slow"
+                    speed_text = QUICK_PING_SPEED_LABELS[bisect_right(SPEED_THRESHOLDS, result["response_time"])]
                 else:
                     status_icon = "🔴"
                     status_text = "OFFLINE"
                     speed_text = "❌ Failed"
                 
-                message += f"{status_icon} **{status_text}**\n"
-                message += f"   🌐 `{url[:40]}{'...' if len(url) > 40 else ''}`\n"
-                message += f"   📊 Status: {result['status_code']} | {speed_text} ({result['response_time']:.3f}s)\n\n"
+                short_url = self.url_monitor.url_html(url, 40)
+                parts.append(
+                    f"{status_icon} <b>{status_text}</b>\n"
+                    f"   🌐 <code>{short_url}</code>\n"
+                    f"   📊 Status: {result['status_code']} | {speed_text} ({result['response_time']:.3f}s)\n\n"
+                )
             
             # Summary stats
             avg_response = total_response_time / online_count if online_count > 0 else 0
             success_rate = (online_count / len(results)) * 100
             
-            message += f"📈 **Performance Summary:**\n"
-            message += f"✅ Success Rate: {success_rate:.1f}%\n"
-            message += f"⚡ Average Response: {avg_response:.3f}s\n"
-            message += f"🕐 Completed: {datetime.now().strftime('%H:%M:%S')}"
-            
-            keyboard = [
-                [
-                    InlineKeyboardButton("📊 View Stats", callback_data="main_stats"),
-                    InlineKeyboardButton("🌐 URL Dashboard", callback_data="main_urls")
-                ],
-                [
-                    InlineKeyboardButton("🔄 Ping Again", callback_data="quick_ping"),
-                    InlineKeyboardButton("🏠 Main Menu", callback_data="main_menu")
-                ]
-            ]
-            reply_markup = InlineKeyboardMarkup(keyboard)
+            parts.append(
+                f"📈 <b>Performance Summary:</b>\n"
+                f"✅ Success Rate: {success_rate:.1f}%\n"
+                f"⚡ Average Response: {avg_response:.3f}s\n"
+                f"🕐 Completed: {time.strftime('%H:%M:%S')}"
+            )
+            message = "".join(parts)
             
-            await query.edit_message_text(
+            await self._edit_query(query,
                 message,
-                parse_mode='Markdown',
-                reply_markup=reply_markup
+                parse_mode=ParseMode.HTML,
+                reply_markup=QUICK_PING_RESULT_KEYBOARD
             )
             
         except Exception as e:
             logger.error(f"Error in quick ping callback: {e}")
-            await query.edit_message_text(
-                f"❌ **Ping Operation Failed**\n\n"
+            await asyncio.gather(*edits, return_exceptions=True)
+            await self._edit_query(query,
+                f"❌ <b>Ping Operation Failed</b>\n\n"
                 f"An error occurred during the ping sequence.\n"
-                f"**Error:** {str(e)}\n\n"
+                f"<b>Error:</b> {html.escape(str(e))}\n\n"
                 f"Please try again or check your URLs.",
-                parse_mode='Markdown'
+                parse_mode=ParseMode.HTML
             )
     
     async def _handle_analytics_callback(self, query):
         """Handle analytics dashboard"""
-        await query.edit_message_text(
-            "📈 **Advanced Analytics Dashboard** 📈\n\n"
-            "🚀 **Coming Soon:**\n"
-            "• Performance trend analysis\n"
-            "• Predictive downtime alerts\n"
-            "• Custom reporting periods\n"
-            "• Export data capabilities\n"
-            "• Historical comparison charts\n\n"
-            "This feature is currently in development.",
-            parse_mode='Markdown',
-            reply_markup=InlineKeyboardMarkup([
-                [InlineKeyboardButton("🏠 Main Menu", callback_data="main_menu")]
-            ])
-        )
+        await self._edit_query(query, ANALYTICS_MSG, parse_mode=ParseMode.HTML, reply_markup=MAIN_MENU_KEYBOARD)
     
     async def _handle_alerts_callback(self, query):
         """Handle alerts management"""
-        await query.edit_message_text(
-            "🔔 **Smart Alert System** 🔔\n\n"
-            "🎯 **Alert Status:** Active\n"
-            "⚡ **Response Time:** Instant\n"
-            "🔄 **Auto-Recovery Detection:** Enabled\n\n"
-            "🚀 **Advanced Features:**\n"
-            "• Real-time downtime notifications\n"
-            "• Smart recovery alerts\n"
-            "• Performance degradation warnings\n"
-            "• Custom alert thresholds\n\n"
-            "All alerts are automatically sent to this chat.",
-            parse_mode='Markdown',
-            reply_markup=InlineKeyboardMarkup([
-                [InlineKeyboardButton("🏠 Main Menu", callback_data="main_menu")]
-            ])
-        )
+        await self._edit_query(query, ALERTS_MSG, parse_mode=ParseMode.HTML, reply_markup=MAIN_MENU_KEYBOARD)
     
     async def _handle_help_menu_callback(self, query):
         """Handle help menu"""
-        help_msg = (
-            "🆘 **Interactive Help Center** 🆘\n\n"
-            "🎯 **Quick Navigation:**\n"
-            "Use the interactive buttons for fast access to all features!\n\n"
-            "⚡ **Speed Tips:**\n"
-            "• Dashboard shows real-time status\n"
-            "• Tap URLs for detailed information\n"
-            "• Use Quick Ping for instant checks\n"
-            "• Analytics provide deep insights\n\n"
-            "🚀 **Pro Features:**\n"
-            "• Animated loading indicators\n"
-            "• Progress tracking\n"
-            "• Mobile-optimized interface\n"
-            "• Smart error handling"
-        )
-        
-        keyboard = [
-            [
-                InlineKeyboardButton("🚀 Dashboard", callback_data="main_menu"),
-                InlineKeyboardButton("📊 Quick Stats", callback_data="main_stats")
-            ],
-            [
-                InlineKeyboardButton("🌐 URLs", callback_data="main_urls"),
-                InlineKeyboardButton("⚙️ Settings", callback_data="main_settings")
-            ]
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
-        
-        await query.edit_message_text(help_msg, parse_mode='Markdown', reply_markup=reply_markup)
+        await self._edit_query(query, HELP_MENU_MSG, parse_mode=ParseMode.HTML, reply_markup=HELP_MENU_KEYBOARD)
     
     async def _handle_add_url_wizard_callback(self, query):
         """Handle add URL wizard"""
-        await query.edit_message_text(
-            "➕ **Smart URL Addition Wizard** ➕\n\n"
-            "🎯 **Ready to add a new URL for monitoring!**\n\n"
-            "✨ **Features:**\n"
-            "• Automatic URL validation\n"
-            "• Instant connectivity testing\n"
-            "• Smart protocol detection\n"
-            "• Real-time status updates\n\n"
-            "📝 **How to add:**\n"
-            "Type: `/seturl <your-url>`\n\n"
-            "📌 **Example:**\n"
-            "`/seturl https://myapp.herokuapp.com`\n\n"
-            "💡 **Tip:** You can omit 'https://' - I'll add it automatically!",
-            parse_mode='Markdown',
-            reply_markup=InlineKeyboardMarkup([
-                [InlineKeyboardButton("🏠 Main Menu", callback_data="main_menu")]
-            ])
-        )
+        await self._edit_query(query, ADD_URL_WIZARD_MSG, parse_mode=ParseMode.HTML, reply_markup=MAIN_MENU_KEYBOARD)
     
     async def _handle_remove_url_menu_callback(self, query):
         """Handle remove URL menu"""
-        urls = self.url_monitor.get_urls(str(query.message.chat.id))
+        chat_id = str(query.message.chat.id)
+        urls = self.url_monitor.get_urls(chat_id)
         
         if not urls:
-            await query.edit_message_text(
-                "🗑️ **Remove URL Menu** 🗑️\n\n"
-                "📭 **No URLs to Remove**\n\n"
-                "You don't have any URLs currently being monitored.\n"
-                "Add some URLs first to enable removal options!",
-                parse_mode='Markdown',
-                reply_markup=InlineKeyboardMarkup([
-                    [
-                        InlineKeyboardButton("➕ Add URL", callback_data="add_url_wizard"),
-                        InlineKeyboardButton("🏠 Main Menu", callback_data="main_menu")
-                    ]
-                ])
+            await self._edit_query(query,
+                REMOVE_MENU_EMPTY_MSG,
+                parse_mode=ParseMode.HTML,
+                reply_markup=REMOVE_MENU_EMPTY_KEYBOARD
             )
             return
         
         # Create the remove URL interface
         reply_markup = self.advanced_ui.create_remove_url_keyboard(urls)
         
-        message = f"🗑️ **Smart URL Removal Wizard** 🗑️\n\n"
-        message += f"🎯 **Ready to remove URLs from monitoring!**\n\n"
-        message += f"✨ **Features:**\n"
-        message += f"• Instant URL removal\n"
-        message += f"• Clean database cleanup\n"
-        message += f"• Stop monitoring immediately\n"
-        message += f"• Smart confirmation system\n\n"
-        message += f"📊 **Currently monitoring {len(urls)} URLs**\n\n"
-        message += f"📝 **How to remove:**\n"
-        message += f"1. Click on any URL below to select it\n"
-        message += f"2. Confirm your removal choice\n"
-        message += f"3. URL will be removed instantly\n\n"
-        message += f"💡 **Tip:** You can also use `/removeurl <url>` command!\n\n"
-        message += f"⚠️ **Note:** Removal is immediate and cannot be undone."
-        
-        await query.edit_message_text(
+        message = f"{REMOVE_MENU_HEAD}📊 <b>Currently monitoring {len(urls)} URLs</b>\n\n{REMOVE_MENU_TAIL}"
+        
+        await self._edit_query(query,
             message,
-            parse_mode='Markdown',
+            parse_mode=ParseMode.HTML,
             reply_markup=reply_markup
         )
     
     async def _handle_admin_panel_callback(self, query):
         """Handle admin panel callback"""
         if not self.config.is_primary_admin(query.from_user.id):
-            await query.edit_message_text(
-                "🔒 **Access Denied**\n\n"
+            await self._edit_query(query,
+                "🔒 <b>Access Denied</b>\n\n"
                 "Only the primary admin can access the admin panel.",
-                parse_mode='Markdown',
-                reply_markup=InlineKeyboardMarkup([
-                    [InlineKeyboardButton("🏠 Main Menu", callback_data="main_menu")]
-                ])
+                parse_mode=ParseMode.HTML,
+                reply_markup=MAIN_MENU_KEYBOARD
             )
             return
         
         admin_list = self.config.get_admin_list()
         
-        message = "👥 **Admin Management Panel**\n\n"
-        message += f"**Total Admins:** {len(admin_list)}\n\n"
+        parts = [
+            "👥 <b>Admin Management Panel</b>\n\n",
+            f"<b>Total Admins:</b> {len(admin_list)}\n\n"
+        ]
         
         # Show first 5 admins
+        primary_id = self.config.primary_admin_chat_id
         for i, admin_id in enumerate(admin_list[:5], 1):
-            if admin_id == self.config.primary_admin_chat_id:
-                message += f"**{i}.** `{admin_id}` 👑 **Primary**\n"
+            if admin_id == primary_id:
+                parts.append(f"<b>{i}.</b> <code>{admin_id}</code> 👑 <b>Primary</b>\n")
             else:
-                message += f"**{i}.** `{admin_id}`\n"
+                parts.append(f"<b>{i}.</b> <code>{admin_id}</code>\n")
         
         if len(admin_list) > 5:
-            message += f"... and {len(admin_list) - 5} more\n"
+            parts.append(f"... and {len(admin_list) - 5} more\n")
         
-        message += f"\n**Quick Commands:**\n"
-        message += f"• Use `/addadmin <chat_id>` to add new admin\n"
-        message += f"• Use `/removeadmin <chat_id>` to remove admin\n"
-        message += f"• Use `/listadmins` for complete list"
+        parts.append(ADMIN_PANEL_COMMANDS)
+        message = "".join(parts)
         
-        keyboard = [
-            [
-                InlineKeyboardButton("➕ Add Admin", callback_data="add_admin_help"),
-                InlineKeyboardButton("➖ Remove Admin", callback_data="remove_admin_help")
-            ],
-            [
-                InlineKeyboardButton("📋 Full Admin List", callback_data="show_all_admins"),
-                InlineKeyboardButton("ℹ️ How to Get Chat ID", callback_data="chat_id_help")
-            ],
-            [
-                InlineKeyboardButton("🏠 Main Menu", callback_data="main_menu")
-            ]
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
-        
-        await query.edit_message_text(
+        await self._edit_query(query,
             message,
-            parse_mode='Markdown',
-            reply_markup=reply_markup
+            parse_mode=ParseMode.HTML,
+            reply_markup=ADMIN_PANEL_KEYBOARD
         )
     
-    async def _handle_urls_page_callback(self, query, page):
+    async def _handle_urls_page_callback(self, query, arg: str):
         """Handle URL pagination"""
-        urls = self.url_monitor.get_urls(str(query.message.chat.id))
-        message, reply_markup = self.advanced_ui.format_enhanced_url_list(urls, page)
-        
-        await query.edit_message_text(
+        chat_id = str(query.message.chat.id)
+        try:
+            page = max(0, int(arg))
+        except ValueError:
+            page = 0
+        
+        # Page flips between changes reuse the render without touching the URL data
+        key = (chat_id, self.url_monitor.get_urls_version(chat_id), page)
+        now = time.monotonic()
+        cached = self._page_cache.get(key)
+        if cached is None or now - cached[0] >= self.page_cache_ttl:
+            urls = self.url_monitor.get_urls(chat_id)
+            cached = (now, self.advanced_ui.format_enhanced_url_list(urls, page))
+            self._page_cache[key] = cached
+            self._page_cache.move_to_end(key)
+            if len(self._page_cache) > self._page_cache_size:
+                self._page_cache.popitem(last=False)
+        message, reply_markup = cached[1]
+        
+        await self._edit_query(query,
             message,
-            parse_mode='Markdown',
+            parse_mode=ParseMode.HTML,
             reply_markup=reply_markup
         )
     
-    async def _handle_test_url_callback(self, query, url_hash):
+    async def _handle_test_url_callback(self, query, arg: str):
         """Handle individual URL testing"""
-        if url_hash not in self.url_hash_map:
-            await query.edit_message_text("❌ URL not found. Please refresh and try again.")
+        chat_id = str(query.message.chat.id)
+        url_id = self._parse_url_id(arg)
+        url = self.url_monitor.get_url_by_id(url_id, chat_id)
+        if url is None:
+            await self._edit_query(query, "❌ URL not found. Please refresh and try again.")
             return
         
-        url = self.url_hash_map[url_hash]
-        
-        await query.edit_message_text(
-            f"🧪 **Testing URL** 🧪\n\n"
-            f"🌐 `{url}`\n\n"
-            f"⚡ Running connectivity test...\n"
-            f"📊 Measuring response time...\n"
-            f"🔍 Analyzing performance...",
-            parse_mode='Markdown'
-        )
-        
-        # Perform single URL test
+        # Perform single URL test; the "Testing..." toast covers the wait
         result = await self.url_monitor.ping_url(url)
         
         if result["success"]:
             status_icon = "✅"
             status_text = "ONLINE"
-            if result["response_time"] < 1.0:
-                performance = "⚡ Excellent"
-            elif result["response_time"] < 3.0:
-                performance = "🟡 Good"
-            else:
-                performance = "🔴 Slow"
+            performance = TEST_URL_PERFORMANCE_LABELS[bisect_right(SPEED_THRESHOLDS, result["response_time"])]
         else:
             status_icon = "❌"
             status_text = "OFFLINE"
             performance = "🚫 Failed"
         
-        message = f"🧪 **URL Test Results** 🧪\n\n"
-        message += f"🌐 **URL:** `{url}`\n"
-        message += f"{status_icon} **Status:** {status_text}\n"
-        message += f"📊 **HTTP Code:** {result['status_code']}\n"
-        message += f"⏱️ **Response Time:** {result['response_time']:.3f}s\n"
-        message += f"📈 **Performance:** {performance}\n"
+        message = f"🧪 <b>URL Test Results</b> 🧪\n\n"
+        message += f"🌐 <b>URL:</b> <code>{self.url_monitor.url_html(url)}</code>\n"
+        message += f"{status_icon} <b>Status:</b> {status_text}\n"
+        message += f"📊 <b>HTTP Code:</b> {result['status_code']}\n"
+        message += f"⏱️ <b>Response Time:</b> {result['response_time']:.3f}s\n"
+        message += f"📈 <b>Performance:</b> {performance}\n"
         
         if result.get("error"):
-            message += f"⚠️ **Error:** {result['error']}\n"
+            message += f"⚠️ <b>Error:</b> {html.escape(str(result['error']))}\n"
         
-        message += f"\n🕐 **Test Time:** {datetime.now().strftime('%H:%M:%S')}"
+        message += f"\n🕐 <b>Test Time:</b> {time.strftime('%H:%M:%S')}"
         
         keyboard = [
             [
-                InlineKeyboardButton("🔄 Test Again", callback_data=f"test_url:{url_hash}"),
+                InlineKeyboardButton("🔄 Test Again", callback_data=f"test_url:{url_id}"),
                 InlineKeyboardButton("📊 View Stats", callback_data="main_stats")
             ],
             [
                 InlineKeyboardButton("🌐 All URLs", callback_data="main_urls"),
-                InlineKeyboardButton("🏠 Main Menu", callback_data="main_menu")
+                BTN_MAIN_MENU
             ]
         ]
         reply_markup = InlineKeyboardMarkup(keyboard)
         
-        await query.edit_message_text(
+        await self._edit_query(query,
             message,
-            parse_mode='Markdown',
+            parse_mode=ParseMode.HTML,
             reply_markup=reply_markup
         )
     
-    async def _handle_remove_url_callback(self, query, url_hash):
+    async def _handle_url_detail_callback(self, query, arg: str):
+        """Handle detailed view of a single URL"""
+        chat_id = str(query.message.chat.id)
+        url = self.url_monitor.get_url_by_id(self._parse_url_id(arg), chat_id)
+        url_data = self.url_monitor.get_url_data(url, chat_id) if url is not None else None
+        if url_data is None:
+            await self._edit_query(query, "❌ URL not found. Please refresh and try again.")
+            return
+        
+        message, reply_markup = self.advanced_ui.create_url_detail_view(url, url_data, chat_id)
+        
+        await self._edit_query(query,
+            message,
+            parse_mode=ParseMode.HTML,
+            reply_markup=reply_markup
+        )
+    
+    async def _handle_remove_url_callback(self, query, arg: str):
         """Handle URL removal through button interface"""
-        if url_hash not in self.url_hash_map:
-            await query.edit_message_text(
+        chat_id = str(query.message.chat.id)
+        url_id = self._parse_url_id(arg)
+        url = self.url_monitor.get_url_by_id(url_id, chat_id)
+        if url is None:
+            await self._edit_query(query,
                 "❌ URL not found. Please refresh and try again.",
-                reply_markup=InlineKeyboardMarkup([
-                    [InlineKeyboardButton("🔄 Refresh URLs", callback_data="main_urls")],
-                    [InlineKeyboardButton("🏠 Main Menu", callback_data="main_menu")]
-                ])
+                reply_markup=URLS_AND_MAIN_MENU_KEYBOARD
             )
             return
         
-        url = self.url_hash_map[url_hash]
-        
         # Show confirmation message
-        await query.edit_message_text(
-            f"🗑️ **Confirm URL Removal**\n\n"
-            f"**URL:** `{url}`\n\n"
+        await self._edit_query(query,
+            f"🗑️ <b>Confirm URL Removal</b>\n\n"
+            f"<b>URL:</b> <code>{self.url_monitor.url_html(url)}</code>\n\n"
             f"⚠️ This will stop monitoring this URL permanently.\n"
             f"Are you sure you want to remove it?",
-            parse_mode='Markdown',
+            parse_mode=ParseMode.HTML,
             reply_markup=InlineKeyboardMarkup([
                 [
-                    InlineKeyboardButton("✅ Yes, Remove", callback_data=f"confirm_remove:{url_hash}"),
+                    InlineKeyboardButton("✅ Yes, Remove", callback_data=f"confirm_remove:{url_id}"),
                     InlineKeyboardButton("❌ Cancel", callback_data="main_urls")
                 ]
             ])
         )
     
-    async def _handle_confirm_remove_callback(self, query, url_hash):
+    async def _handle_confirm_remove_callback(self, query, arg: str):
         """Handle confirmed URL removal"""
-        if url_hash not in self.url_hash_map:
-            await query.edit_message_text(
+        chat_id = str(query.message.chat.id)
+        url_id = self._parse_url_id(arg)
+        url = self.url_monitor.get_url_by_id(url_id, chat_id)
+        if url is None:
+            await self._edit_query(query,
                 "❌ URL not found. Please refresh and try again.",
-                reply_markup=InlineKeyboardMarkup([
-                    [InlineKeyboardButton("🔄 Refresh URLs", callback_data="main_urls")],
-                    [InlineKeyboardButton("🏠 Main Menu", callback_data="main_menu")]
-                ])
+                reply_markup=URLS_AND_MAIN_MENU_KEYBOARD
             )
             return
         
-        url = self.url_hash_map[url_hash]
-        
-        # Show processing message
-        await query.edit_message_text(
-            f"🗑️ **Removing URL...**\n\n"
-            f"**URL:** `{url}`\n\n"
-            f"⏳ Stopping monitoring...\n"
-            f"⏳ Removing from database...\n"
-            f"⏳ Cleaning up resources...",
-            parse_mode='Markdown'
-        )
-        
-        # Remove URL from monitoring
-        success = self.url_monitor.remove_url(url, str(query.message.chat.id))
+        # Remove URL from monitoring; the "Removing" toast already acknowledged the press
+        success = await self.url_monitor.aremove_url(url, chat_id)
         
         if success:
-            # Remove from hash mapping
-            if url_hash in self.url_hash_map:
-                del self.url_hash_map[url_hash]
-            
             # Show success message
-            keyboard = [
-                [
-                    InlineKeyboardButton("📋 View Remaining URLs", callback_data="main_urls"),
-                    InlineKeyboardButton("➕ Add New URL", callback_data="add_url_wizard")
-                ],
-                [
-                    InlineKeyboardButton("🏠 Main Menu", callback_data="main_menu")
-                ]
-            ]
-            reply_markup = InlineKeyboardMarkup(keyboard)
-            
-            await query.edit_message_text(
-                f"✅ **URL Removed Successfully!**\n\n"
-                f"**Removed URL:** `{url}`\n"
-                f"**Status:** No longer monitoring\n\n"
+            await self._edit_query(query,
+                f"✅ <b>URL Removed Successfully!</b>\n\n"
+                f"<b>Removed URL:</b> <code>{html.escape(url)}</code>\n"
+                f"<b>Status:</b> No longer monitoring\n\n"
                 f"This URL will no longer receive keep-alive pings.",
-                parse_mode='Markdown',
-                reply_markup=reply_markup
+                parse_mode=ParseMode.HTML,
+                reply_markup=REMOVE_SUCCESS_KEYBOARD
             )
         else:
-            await query.edit_message_text(
-                f"❌ **Failed to Remove URL**\n\n"
-                f"**URL:** `{url}`\n"
+            await self._edit_query(query,
+                f"❌ <b>Failed to Remove URL</b>\n\n"
+                f"<b>URL:</b> <code>{html.escape(url)}</code>\n"
                 f"This URL may not exist in the monitoring system.\n\n"
                 f"Use the URL list to see all monitored URLs.",
-                parse_mode='Markdown',
-                reply_markup=InlineKeyboardMarkup([
-                    [InlineKeyboardButton("📋 View URLs", callback_data="main_urls")],
-                    [InlineKeyboardButton("🏠 Main Menu", callback_data="main_menu")]
-                ])
+                parse_mode=ParseMode.HTML,
+                reply_markup=REMOVE_FAILED_KEYBOARD
             )
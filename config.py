@@ -2,14 +2,19 @@
 Configuration management for Telegram URL Monitor Bot
 """
 
+import asyncio
+import itertools
+import json
 import os
 import logging
+import threading
+from utils import load_json_file, dump_json, write_file_atomic
 
 logger = logging.getLogger(__name__)
 
 class Config:
     def __init__(self):
-        self.bot_token = "8405898835:AAE6gmya8TGXPjHeLt0NObIqFQv4mLreqxM"
+        self.bot_token = self._get_bot_token()
         self.primary_admin_chat_id = 1691680798  # Main admin who can manage other admins
         self.admin_chat_ids = [1691680798]  # List of all admin chat IDs
         self.admin_data_file = "admin_data.json"  # File to store admin list
@@ -17,11 +22,21 @@ class Config:
         self.request_timeout = 30  # seconds
         self.data_file = "urls_data.json"
         self.log_file = "bot.log"
+        self._admin_set = frozenset(self.admin_chat_ids)  # O(1) lookups; list keeps file order
+        self.admin_save_delay = 1.0  # seconds; admin list writes are batched
+        self._admin_dirty = False
+        self._admin_save_handle = None
+        # Executor and synchronous writes share the temp file; the lock serializes
+        # them and the sequence keeps an older snapshot from replacing a newer one
+        self._admin_save_lock = threading.Lock()
+        self._admin_save_seq = itertools.count(1)
+        self._admin_written_seq = 0
         self._load_admin_data()
+        self.validate_config()
         
     def _get_bot_token(self):
         """Get bot token from environment variables"""
-        token = os.getenv("BOT_TOKEN", "8405898835:AAE6gmya8TGXPjHeLt0NObIqFQv4mLreqxM")
+        token = os.getenv("BOT_TOKEN")
         if not token:
             raise ValueError("BOT_TOKEN environment variable is required")
         return token
@@ -39,36 +54,75 @@ class Config:
     
     def _load_admin_data(self):
         """Load admin chat IDs from file"""
-        import json
         try:
-            with open(self.admin_data_file, 'r') as f:
-                data = json.load(f)
-                self.admin_chat_ids = data.get('admin_chat_ids', [self.primary_admin_chat_id])
-                # Ensure primary admin is always in the list
-                if self.primary_admin_chat_id not in self.admin_chat_ids:
-                    self.admin_chat_ids.append(self.primary_admin_chat_id)
+            data = load_json_file(self.admin_data_file)
+            self.admin_chat_ids = [int(chat_id) for chat_id in data.get('admin_chat_ids', [self.primary_admin_chat_id])]
+            # Ensure primary admin is always in the list
+            if self.primary_admin_chat_id not in self.admin_chat_ids:
+                self.admin_chat_ids.append(self.primary_admin_chat_id)
+            self._admin_set = frozenset(self.admin_chat_ids)
         except (FileNotFoundError, json.JSONDecodeError):
             # Create default admin data file
             self._save_admin_data()
             logger.info("Created default admin data file")
     
-    def _save_admin_data(self):
-        """Save admin chat IDs to file"""
-        import json
+    def _admin_snapshot(self, admin_chat_ids=None):
+        """Serialize the admin list now, tagged with an increasing sequence number"""
+        admin_chat_ids = self.admin_chat_ids if admin_chat_ids is None else admin_chat_ids
+        data = {
+            'admin_chat_ids': admin_chat_ids,
+            'primary_admin': self.primary_admin_chat_id
+        }
+        return next(self._admin_save_seq), dump_json(data), len(admin_chat_ids)
+    
+    def _write_admin_snapshot(self, seq, raw, count):
+        """Write a serialized admin list unless a newer one is already on disk"""
         try:
-            data = {
-                'admin_chat_ids': self.admin_chat_ids,
-                'primary_admin': self.primary_admin_chat_id
-            }
-            with open(self.admin_data_file, 'w') as f:
-                json.dump(data, f, indent=2)
-            logger.info(f"Saved admin data with {len(self.admin_chat_ids)} admins")
+            with self._admin_save_lock:
+                if seq < self._admin_written_seq:
+                    return
+                write_file_atomic(self.admin_data_file, raw)
+                self._admin_written_seq = seq
+            logger.info(f"Saved admin data with {count} admins")
         except Exception as e:
             logger.error(f"Error saving admin data: {e}")
     
+    def _save_admin_data(self):
+        """Save admin chat IDs to file"""
+        self._write_admin_snapshot(*self._admin_snapshot())
+    
+    def _schedule_admin_save(self):
+        """Coalesce admin list writes into one background save shortly after the last change"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop (startup, scripts): save right away
+            self._save_admin_data()
+            return
+        
+        self._admin_dirty = True
+        if self._admin_save_handle is None:
+            self._admin_save_handle = loop.call_later(self.admin_save_delay, self._flush_admin_data, loop)
+    
+    def _flush_admin_data(self, loop):
+        """Write a snapshot of the admin list off the event loop"""
+        self._admin_save_handle = None
+        if self._admin_dirty:
+            self._admin_dirty = False
+            loop.run_in_executor(None, self._write_admin_snapshot, *self._admin_snapshot())
+    
+    def flush(self):
+        """Write any pending admin list changes immediately"""
+        if self._admin_save_handle is not None:
+            self._admin_save_handle.cancel()
+            self._admin_save_handle = None
+        if self._admin_dirty:
+            self._admin_dirty = False
+            self._save_admin_data()
+    
     def is_admin(self, chat_id):
         """Check if the given chat ID is an admin"""
-        return chat_id in self.admin_chat_ids
+        return chat_id in self._admin_set
     
     def is_primary_admin(self, chat_id):
         """Check if the given chat ID is the primary admin"""
@@ -76,20 +130,24 @@ class Config:
     
     def add_admin(self, chat_id):
         """Add a new admin chat ID"""
-        if chat_id not in self.admin_chat_ids:
+        chat_id = int(chat_id)
+        if chat_id not in self._admin_set:
             self.admin_chat_ids.append(chat_id)
-            self._save_admin_data()
+            self._admin_set = frozenset(self.admin_chat_ids)
+            self._schedule_admin_save()
             logger.info(f"Added new admin: {chat_id}")
             return True
         return False
     
     def remove_admin(self, chat_id):
         """Remove an admin chat ID (except primary admin)"""
+        chat_id = int(chat_id)
         if chat_id == self.primary_admin_chat_id:
             return False  # Cannot remove primary admin
-        if chat_id in self.admin_chat_ids:
+        if chat_id in self._admin_set:
             self.admin_chat_ids.remove(chat_id)
-            self._save_admin_data()
+            self._admin_set = frozenset(self.admin_chat_ids)
+            self._schedule_admin_save()
             logger.info(f"Removed admin: {chat_id}")
             return True
         return False
@@ -105,7 +163,7 @@ class Config:
         if not self.bot_token:
             errors.append("Bot token is missing")
         
-        if not self.admin_chat_id:
+        if not self.admin_chat_ids:
             errors.append("Admin chat ID is missing")
         
         if self.ping_interval <= 0:
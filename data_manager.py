@@ -2,18 +2,28 @@
 Data persistence manager for URL monitoring data
 """
 
+import asyncio
+import itertools
 import json
 import os
 import logging
+import threading
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+from utils import get_status_emoji, truncate_url, load_json_file, dump_json, write_file_atomic
 
 logger = logging.getLogger(__name__)
 
 class DataManager:
     def __init__(self, data_file: str = "urls_data.json"):
         self.data_file = data_file
+        # Snapshots are numbered when taken so a slow background write never
+        # replaces a newer file on disk
+        self._save_lock = threading.Lock()
+        self._save_seq = itertools.count(1)
+        self._written_seq = 0
         self.data = self._load_data()
+        self._next_url_id = self._assign_url_ids()
     
     def _load_data(self) -> Dict[str, Any]:
         """Load data from JSON file"""
@@ -22,7 +32,9 @@ class DataManager:
             # Legacy support - will be migrated
             "urls": {},  
             "ping_history": {},  
-            "downtime_incidents": {}  
+            "downtime_incidents": {},
+            # Next URL id to hand out; persisted so ids of removed URLs are never reused
+            "next_url_id": 1
         }
         
         if not os.path.exists(self.data_file):
@@ -31,29 +43,46 @@ class DataManager:
             return default_data
         
         try:
-            with open(self.data_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                # Ensure all required keys exist
-                for key in default_data:
-                    if key not in data:
-                        data[key] = default_data[key]
-                logger.info(f"Loaded data from {self.data_file}")
-                # Migrate legacy data if needed
-                data = self._migrate_legacy_data(data)
-                return data
+            data = load_json_file(self.data_file)
+            # Ensure all required keys exist
+            for key in default_data:
+                if key not in data:
+                    data[key] = default_data[key]
+            logger.info(f"Loaded data from {self.data_file}")
+            # Migrate legacy data if needed
+            data = self._migrate_legacy_data(data)
+            return data
         except (json.JSONDecodeError, FileNotFoundError) as e:
             logger.error(f"Error loading data file: {e}")
             logger.info("Creating new data file with default structure")
             self._save_data(default_data)
             return default_data
     
+    def _snapshot(self, data: Optional[Dict[str, Any]] = None) -> Tuple[int, bytes]:
+        """Serialize the data now, tagged with an increasing sequence number"""
+        return next(self._save_seq), dump_json(data if data is not None else self.data)
+    
+    def _write_snapshot(self, seq: int, raw: bytes):
+        """Write a serialized snapshot unless a newer one is already on disk"""
+        with self._save_lock:
+            if seq < self._written_seq:
+                return
+            write_file_atomic(self.data_file, raw)
+            self._written_seq = seq
+        logger.debug(f"Data saved to {self.data_file}")
+    
     def _save_data(self, data: Optional[Dict[str, Any]] = None):
         """Save data to JSON file"""
         try:
-            data_to_save = data if data is not None else self.data
-            with open(self.data_file, 'w', encoding='utf-8') as f:
-                json.dump(data_to_save, f, indent=2, ensure_ascii=False)
-            logger.debug(f"Data saved to {self.data_file}")
+            self._write_snapshot(*self._snapshot(data))
+        except Exception as e:
+            logger.error(f"Error saving data: {e}")
+    
+    async def save_data_async(self):
+        """Save data to JSON file with the disk write done off the event loop"""
+        try:
+            seq, raw = self._snapshot()
+            await asyncio.get_running_loop().run_in_executor(None, self._write_snapshot, seq, raw)
         except Exception as e:
             logger.error(f"Error saving data: {e}")
     
@@ -83,6 +112,28 @@ class DataManager:
         
         return data
     
+    def _assign_url_ids(self) -> int:
+        """Give every URL record a stable integer id and return the next free id"""
+        records = [
+            record
+            for admin_data in self.data["admin_data"].values()
+            for record in admin_data["urls"].values()
+        ]
+        next_id = max((record["id"] for record in records if "id" in record), default=0) + 1
+        next_id = max(next_id, self.data["next_url_id"])
+        
+        missing_ids = False
+        for record in records:
+            if "id" not in record:
+                record["id"] = next_id
+                next_id += 1
+                missing_ids = True
+        
+        if missing_ids or self.data["next_url_id"] != next_id:
+            self.data["next_url_id"] = next_id
+            self._save_data()
+        return next_id
+    
     def _ensure_admin_data(self, admin_chat_id: str):
         """Ensure admin has their own data structure"""
         if admin_chat_id not in self.data["admin_data"]:
@@ -92,19 +143,31 @@ class DataManager:
                 "downtime_incidents": {}
             }
     
-    def add_url(self, url: str, admin_chat_id: str) -> bool:
+    def add_url(self, url: str, admin_chat_id: str, save: bool = True) -> bool:
         """Add a new URL to monitor for specific admin"""
         self._ensure_admin_data(admin_chat_id)
         admin_data = self.data["admin_data"][admin_chat_id]
         
-        if url in admin_data["urls"]:
+        existing = admin_data["urls"].get(url)
+        if existing is not None:
             logger.info(f"URL {url} already exists for admin {admin_chat_id}, updating timestamp")
+            url_id = existing["id"]
+        else:
+            url_id = self._next_url_id
+            self._next_url_id += 1
+            self.data["next_url_id"] = self._next_url_id
         
         admin_data["urls"][url] = {
+            "id": url_id,
             "added_at": datetime.now().isoformat(),
             "last_check": None,
             "status": "pending",
-            "response_time": None
+            "status_emoji": get_status_emoji("pending"),
+            "response_time": None,
+            # Truncated display forms used by the UI, computed once per URL
+            "short_url_25": truncate_url(url, 25),
+            "short_url_30": truncate_url(url, 30),
+            "short_url_50": truncate_url(url, 50)
         }
         
         if url not in admin_data["ping_history"]:
@@ -113,11 +176,12 @@ class DataManager:
         if url not in admin_data["downtime_incidents"]:
             admin_data["downtime_incidents"][url] = []
         
-        self._save_data()
+        if save:
+            self._save_data()
         logger.info(f"Added URL: {url} for admin {admin_chat_id}")
         return True
     
-    def remove_url(self, url: str, admin_chat_id: str) -> bool:
+    def remove_url(self, url: str, admin_chat_id: str, save: bool = True) -> bool:
         """Remove a URL from monitoring for specific admin"""
         self._ensure_admin_data(admin_chat_id)
         admin_data = self.data["admin_data"][admin_chat_id]
@@ -135,7 +199,8 @@ class DataManager:
         if url in admin_data["downtime_incidents"]:
             del admin_data["downtime_incidents"][url]
         
-        self._save_data()
+        if save:
+            self._save_data()
         logger.info(f"Removed URL: {url} for admin {admin_chat_id}")
         return True
     
@@ -144,16 +209,48 @@ class DataManager:
         self._ensure_admin_data(admin_chat_id)
         return self.data["admin_data"][admin_chat_id]["urls"].copy()
     
-    def get_all_urls(self) -> Dict[str, str]:
-        """Get all URLs from all admins for monitoring purposes (returns url -> admin_id mapping)"""
-        all_urls = {}
+    def get_url_id(self, url: str, admin_chat_id: str) -> Optional[int]:
+        """Get the stable id of a URL for specific admin"""
+        admin_data = self.data["admin_data"].get(admin_chat_id)
+        if not admin_data or url not in admin_data["urls"]:
+            return None
+        return admin_data["urls"][url]["id"]
+    
+    def get_url_data(self, url: str, admin_chat_id: str) -> Optional[Dict[str, Any]]:
+        """Get the record of a single URL for specific admin"""
+        admin_data = self.data["admin_data"].get(admin_chat_id)
+        if not admin_data:
+            return None
+        return admin_data["urls"].get(url)
+    
+    def get_url_ids(self) -> Dict[int, Tuple[str, str]]:
+        """Get all URL ids from all admins (returns id -> (admin_id, url) mapping)"""
+        return {
+            data["id"]: (admin_id, url)
+            for admin_id, admin_data in self.data["admin_data"].items()
+            for url, data in admin_data["urls"].items()
+        }
+    
+    def is_url_monitored(self, url: str) -> bool:
+        """Check whether any admin still monitors a URL"""
+        return any(url in admin_data["urls"] for admin_data in self.data["admin_data"].values())
+    
+    def get_all_urls(self) -> Dict[str, List[str]]:
+        """Get all URLs from all admins for monitoring purposes (returns url -> [admin_id, ...] mapping)"""
+        all_urls: Dict[str, List[str]] = {}
         for admin_id, admin_data in self.data["admin_data"].items():
             for url in admin_data["urls"]:
-                all_urls[url] = admin_id
+                all_urls.setdefault(url, []).append(admin_id)
         return all_urls
     
-    def update_url_status(self, url: str, admin_chat_id: str, status_code: int, response_time: float, success: bool):
-        """Update URL status after a ping for specific admin"""
+    def get_all_urls_as_arrays(self) -> Tuple[List[str], List[List[str]]]:
+        """Get every distinct monitored URL and its owners as two parallel lists (admins[i] own urls[i])"""
+        all_urls = self.get_all_urls()
+        return list(all_urls), list(all_urls.values())
+    
+    def update_url_status(self, url: str, admin_chat_id: str, status_code: int, response_time: float, success: bool,
+                          save: bool = True, now: Optional[datetime] = None):
+        """Update URL status after a ping for specific admin; now defaults to the current time"""
         self._ensure_admin_data(admin_chat_id)
         admin_data = self.data["admin_data"][admin_chat_id]
         
@@ -161,18 +258,26 @@ class DataManager:
             logger.warning(f"Attempted to update status for unknown URL: {url} for admin {admin_chat_id}")
             return
         
-        now = datetime.now()
+        if now is None:
+            now = datetime.now()
+        now_iso = now.isoformat()  # Stored as a string so saves need no datetime conversion
+        status = "online" if success else "offline"
         
         # Update main URL data
         admin_data["urls"][url].update({
-            "last_check": now.isoformat(),
-            "status": "online" if success else "offline",
+            "last_check": now_iso,
+            # Display strings precomputed here so renders skip parse + format; sliced
+            # from the ISO string (YYYY-MM-DDTHH:MM:SS...) rather than strftime'd again
+            "last_check_hms": now_iso[11:19],
+            "last_check_full": f"{now_iso[:10]} {now_iso[11:19]}",
+            "status": status,
+            "status_emoji": get_status_emoji(status),
             "response_time": response_time
         })
         
         # Add to ping history
         ping_record = {
-            "timestamp": now.isoformat(),
+            "timestamp": now_iso,
             "status_code": status_code,
             "response_time": response_time,
             "success": success
@@ -187,7 +292,17 @@ class DataManager:
         # Handle downtime incidents
         self._update_downtime_incidents(url, admin_chat_id, success, now)
         
-        self._save_data()
+        if save:
+            self._save_data()
+    
+    def bulk_update_url_status(self, updates: List[Dict[str, Any]], save: bool = True):
+        """Apply a batch of update_url_status calls with one shared timestamp and save once at the end"""
+        now = datetime.now()
+        for update in updates:
+            self.update_url_status(**update, save=False, now=now)
+        
+        if save and updates:
+            self._save_data()
     
     def _update_downtime_incidents(self, url: str, admin_chat_id: str, success: bool, timestamp: datetime):
         """Track downtime incidents for specific admin"""
@@ -215,15 +330,23 @@ class DataManager:
     
     def get_uptime_stats(self, url: str, admin_chat_id: str, hours: int = 24) -> Dict[str, Any]:
         """Calculate uptime statistics for the last N hours for specific admin"""
-        self._ensure_admin_data(admin_chat_id)
-        admin_data = self.data["admin_data"][admin_chat_id]
-        
-        if url not in admin_data["ping_history"]:
-            return {"uptime_percentage": 0, "total_pings": 0, "successful_pings": 0}
+        return self.compute_uptime_stats(self.get_ping_history(url, admin_chat_id), hours)
+    
+    def get_ping_history(self, url: str, admin_chat_id: str) -> List[Dict[str, Any]]:
+        """Get a copy of a URL's ping history for specific admin
         
+        Later pings append to and trim the stored list, never the records in it, so
+        the copy can be read from another thread.
+        """
+        self._ensure_admin_data(admin_chat_id)
+        return list(self.data["admin_data"][admin_chat_id]["ping_history"].get(url, ()))
+    
+    @staticmethod
+    def compute_uptime_stats(pings: List[Dict[str, Any]], hours: int = 24) -> Dict[str, Any]:
+        """Calculate uptime statistics for the last N hours of a ping history"""
         cutoff_time = datetime.now() - timedelta(hours=hours)
         recent_pings = [
-            ping for ping in admin_data["ping_history"][url]
+            ping for ping in pings
             if datetime.fromisoformat(ping["timestamp"]) > cutoff_time
         ]
         
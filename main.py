@@ -13,6 +13,11 @@ from bot_handlers import BotHandlers
 from url_monitor import URLMonitor
 from web_server import WebServer
 
+try:
+    import uvloop  # Optional: libuv-based event loop, faster for many concurrent pings
+except ImportError:
+    uvloop = None
+
 # Configure logging
 logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
@@ -35,29 +40,39 @@ class TelegramURLBot:
     async def setup_bot(self):
         """Initialize the Telegram bot application"""
         try:
-            # Create application
-            self.application = Application.builder().token(self.config.bot_token).build()
+            # Create application; handlers are non-blocking so a slow /pingnow
+            # never holds up other updates
+            self.application = (
+                Application.builder()
+                .token(self.config.bot_token)
+                .concurrent_updates(True)  # Updates from different chats are handled in parallel
+                # Every handler's API calls share PTB's default keep-alive pool (256
+                # connections); bursts wait for a free connection instead of failing
+                .pool_timeout(30.0)
+                .connect_timeout(5.0)
+                .build()
+            )
             
             # Add command handlers
-            self.application.add_handler(CommandHandler("start", self.bot_handlers.start_command))
-            self.application.add_handler(CommandHandler("help", self.bot_handlers.help_command))
-            self.application.add_handler(CommandHandler("seturl", self.bot_handlers.set_url_command))
-            self.application.add_handler(CommandHandler("removeurl", self.bot_handlers.remove_url_command))
-            self.application.add_handler(CommandHandler("listurls", self.bot_handlers.list_urls_command))
-            self.application.add_handler(CommandHandler("status", self.bot_handlers.status_command))
-            self.application.add_handler(CommandHandler("pingnow", self.bot_handlers.ping_now_command))
+            self.application.add_handler(CommandHandler("start", self.bot_handlers.start_command, block=False))
+            self.application.add_handler(CommandHandler("help", self.bot_handlers.help_command, block=False))
+            self.application.add_handler(CommandHandler("seturl", self.bot_handlers.set_url_command, block=False))
+            self.application.add_handler(CommandHandler("removeurl", self.bot_handlers.remove_url_command, block=False))
+            self.application.add_handler(CommandHandler("listurls", self.bot_handlers.list_urls_command, block=False))
+            self.application.add_handler(CommandHandler("status", self.bot_handlers.status_command, block=False))
+            self.application.add_handler(CommandHandler("pingnow", self.bot_handlers.ping_now_command, block=False))
             
             # Admin management commands
-            self.application.add_handler(CommandHandler("addadmin", self.bot_handlers.add_admin_command))
-            self.application.add_handler(CommandHandler("removeadmin", self.bot_handlers.remove_admin_command))
-            self.application.add_handler(CommandHandler("listadmins", self.bot_handlers.list_admins_command))
+            self.application.add_handler(CommandHandler("addadmin", self.bot_handlers.add_admin_command, block=False))
+            self.application.add_handler(CommandHandler("removeadmin", self.bot_handlers.remove_admin_command, block=False))
+            self.application.add_handler(CommandHandler("listadmins", self.bot_handlers.list_admins_command, block=False))
             
             # Add callback query handler for inline buttons
             from telegram.ext import CallbackQueryHandler
-            self.application.add_handler(CallbackQueryHandler(self.bot_handlers.button_callback))
+            self.application.add_handler(CallbackQueryHandler(self.bot_handlers.button_callback, block=False))
             
             # Add message handler for non-command messages
-            self.application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, self.bot_handlers.handle_message))
+            self.application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, self.bot_handlers.handle_message, block=False))
             
             logger.info("Bot handlers registered successfully")
             
@@ -119,13 +134,18 @@ class TelegramURLBot:
             if self.application:
                 await self.application.stop()
                 await self.application.shutdown()
+            await self.url_monitor.close()
+            self.config.flush()
             logger.info("Bot stopped")
 
 def main():
     """Main entry point"""
     try:
         bot = TelegramURLBot()
-        asyncio.run(bot.run())
+        # Fall back to the stdlib loop when uvloop is not installed (e.g. on Windows)
+        loop_factory = uvloop.new_event_loop if uvloop is not None else None
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            runner.run(bot.run())
     except Exception as e:
         logger.error(f"Failed to start bot: {e}")
 
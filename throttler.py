@@ -0,0 +1,43 @@
+"""
+Per-chat rate limiting for outgoing Telegram messages
+Keeps sends and edits under Telegram's ~1 message/sec/chat limit
+"""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, TypeVar
+from telegram.error import RetryAfter
+from utils import retry_after_seconds
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+class ChatThrottler:
+    def __init__(self, min_interval: float = 1.05, max_retries: int = 3):
+        self.min_interval = min_interval
+        self.max_retries = max_retries
+        self._next_allowed: Dict[int, float] = {}
+    
+    async def send(self, chat_id: int, coro_factory: Callable[[], Awaitable[T]]) -> T:
+        """Run a Telegram API call once the chat's minimum gap has elapsed"""
+        loop = asyncio.get_running_loop()
+        attempt = 0
+        while True:
+            # Reserve the slot before sleeping so concurrent callers queue up behind it
+            now = loop.time()
+            send_at = max(now, self._next_allowed.get(chat_id, 0.0))
+            self._next_allowed[chat_id] = send_at + self.min_interval
+            if send_at > now:
+                await asyncio.sleep(send_at - now)
+            
+            try:
+                return await coro_factory()
+            except RetryAfter as e:
+                attempt += 1
+                wait = retry_after_seconds(e)
+                self._next_allowed[chat_id] = loop.time() + wait
+                if attempt > self.max_retries:
+                    raise
+                logger.warning(f"Rate limited in chat {chat_id}, retrying in {wait}s")
+
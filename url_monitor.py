@@ -4,13 +4,27 @@ URL monitoring service with keep-alive pings and status tracking
 
 import asyncio
 import aiohttp
+import html
 import logging
+import random
+import time
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable, Iterable, List, Tuple
 from data_manager import DataManager
+from utils import validate_url
 
 logger = logging.getLogger(__name__)
 
+ALERT_TEMPLATE = (
+    "🚨 <b>URL DOWN ALERT</b> 🚨\n\n"
+    "<b>URL:</b> <code>{url}</code>\n"
+    "<b>Status Code:</b> {status}\n"
+    "<b>Response Time:</b> {rt:.3f}s\n"
+    "<b>Error:</b> {err}\n"
+    "<b>Time:</b> {ts}\n\n"
+    "Please check the URL status immediately."
+)
+
 class URLMonitor:
     def __init__(self, ping_interval: int = 60, request_timeout: int = 30):
         self.ping_interval = ping_interval
@@ -20,6 +34,35 @@ class URLMonitor:
         self.bot_instance = None
         self.admin_chat_id = None
         self._monitoring_task = None
+        self._by_id = self.data_manager.get_url_ids()  # url id -> (admin_chat_id, url)
+        self._session: Optional[aiohttp.ClientSession] = None  # Shared keep-alive pool for pings
+        self.max_concurrent_pings = 20  # Per manual ping batch
+        self.max_in_flight_pings = 100  # Across all pings; matches the connector limit
+        self._gate = asyncio.Semaphore(self.max_in_flight_pings)
+        self.head_fallback_statuses = frozenset((403, 405, 501))  # Retry these HEAD replies with GET
+        self.url_cache_ttl = 2.0  # seconds
+        self._url_cache: Dict[str, Tuple[float, Dict[str, Dict[str, Any]]]] = {}  # admin -> (time, urls)
+        self._url_versions: Dict[str, int] = {}  # admin -> change counter for rendered views
+        self.status_cache_ttl = 3.0  # seconds
+        self._status_cache: Dict[str, Tuple[float, int, bool, Dict[str, Any]]] = {}  # admin -> (time, version, running, status)
+        self._url_display_cache: Dict[Tuple[str, Optional[int]], str] = {}  # (url, max length) -> HTML-escaped text
+        self._url_tasks: Dict[str, asyncio.Task] = {}  # url -> its ping loop
+        self._url_owners: Dict[str, set] = {}  # url -> admins monitoring it; one ping serves them all
+        self.save_delay = 1.0  # seconds; status saves from many URL loops are coalesced
+        # URLs that failed recently are re-probed at a shorter interval to catch recovery sooner
+        self.failing_interval_factor = 0.5
+        self.failure_memory = 3  # Healthy pings before a failed URL returns to the normal interval
+        self._save_handle: Optional[asyncio.TimerHandle] = None
+        self._save_task: Optional[asyncio.Task] = None
+        # Results that repeat a URL's last (status_code, success) are kept in memory and only
+        # written with the next change, or after status_save_every repeats
+        self.status_save_every = 10
+        self._last_status: Dict[str, Tuple[Tuple[int, bool], int]] = {}  # url -> (state, repeats since saved)
+        self._has_unsaved_results = False
+        self.alert_workers = 2  # Concurrent alert sends; Telegram rate-limits bots anyway
+        self._alert_queue: Optional[asyncio.Queue] = None
+        self._alert_tasks: List[asyncio.Task] = []
+        self._closed = False  # Set by close() so late results cannot restart the alert workers
     
     def set_bot_instance(self, bot):
         """Set the bot instance for sending alerts"""
@@ -29,142 +72,250 @@ class URLMonitor:
         """Set the admin chat ID for alerts"""
         self.admin_chat_id = chat_id
     
-    async def ping_url(self, url: str) -> Dict[str, Any]:
-        """Ping a single URL and return status information"""
-        start_time = datetime.now()
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use inside the running loop"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_in_flight_pings,
+                limit_per_host=20,
+                # Hostnames resolve once per 5 minutes, not once per ping; aiohttp
+                # switches to the non-blocking aiodns resolver when it is installed
+                use_dns_cache=True,
+                ttl_dns_cache=300,
+                keepalive_timeout=75
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.request_timeout)
+            )
+        return self._session
+    
+    async def close(self):
+        """Stop the alert workers, write any pending status save and close the shared HTTP session"""
+        self._closed = True
+        if self._alert_queue is not None:
+            if not self._alert_queue.empty():
+                logger.warning(f"Dropping {self._alert_queue.qsize()} unsent alerts on shutdown")
+            for task in self._alert_tasks:
+                task.cancel()
+            await asyncio.gather(*self._alert_tasks, return_exceptions=True)
+            self._alert_queue = None
+            self._alert_tasks = []
+        if self._save_handle is not None or self._has_unsaved_results:
+            if self._save_handle is not None:
+                self._save_handle.cancel()
+                self._save_handle = None
+            self._has_unsaved_results = False
+            await self.data_manager.save_data_async()
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    async def ping_url(self, url: str, timestamp: Optional[str] = None) -> Dict[str, Any]:
+        """Ping a single URL and return status information
+        
+        timestamp, if given, is the ISO 8601 time stamped into the result (one per ping cycle).
+        """
+        # Pings beyond the pool size wait here instead of piling up DNS lookups and
+        # sockets; the clock starts only once a slot is free
+        async with self._gate:
+            return await self._ping(url, timestamp)
+    
+    async def _ping(self, url: str, timestamp: Optional[str] = None) -> Dict[str, Any]:
+        """Send one probe request to a URL and time it"""
+        # Monotonic loop clock for the latency; wall clock only for the stored timestamp
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        if timestamp is None:
+            timestamp = datetime.now().isoformat()
         
         try:
-            # Configure session with timeout
-            timeout = aiohttp.ClientTimeout(total=self.request_timeout)
+            # Reuse pooled connections instead of a new TCP+TLS handshake per ping
+            session = self._get_session()
+            # One deadline covers the HEAD and any GET fallback, so a ping never
+            # takes longer than request_timeout in total
+            async with asyncio.timeout(self.request_timeout):
+                # HEAD only transfers headers; the timing stops once they arrive
+                async with session.head(url, allow_redirects=True) as response:
+                    status = response.status
+                
+                if status in self.head_fallback_statuses:
+                    # Server refuses HEAD: GET instead, but leave the body unread
+                    async with session.get(url, allow_redirects=True) as response:
+                        status = response.status
+                        response.release()
             
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.get(url, allow_redirects=True) as response:
-                    end_time = datetime.now()
-                    response_time = (end_time - start_time).total_seconds()
-                    
-                    success = 200 <= response.status < 400
-                    
-                    result = {
-                        "url": url,
-                        "status_code": response.status,
-                        "response_time": response_time,
-                        "success": success,
-                        "timestamp": start_time.isoformat(),
-                        "error": None
-                    }
-                    
-                    logger.debug(f"Pinged {url}: {response.status} ({response_time:.3f}s)")
-                    return result
+            response_time = loop.time() - start
+            
+            success = 200 <= status < 400
+            
+            result = self._make_result(url, status, response_time, success, timestamp, None)
+            
+            logger.debug(f"Pinged {url}: {status} ({response_time:.3f}s)")
+            return result
                     
         except asyncio.TimeoutError:
-            end_time = datetime.now()
-            response_time = (end_time - start_time).total_seconds()
-            result = {
-                "url": url,
-                "status_code": 408,  # Request Timeout
-                "response_time": response_time,
-                "success": False,
-                "timestamp": start_time.isoformat(),
-                "error": "Request timeout"
-            }
+            response_time = loop.time() - start
+            # 408 Request Timeout
+            result = self._make_result(url, 408, response_time, False, timestamp, "Request timeout")
             logger.warning(f"Timeout pinging {url} after {response_time:.3f}s")
             return result
             
         except Exception as e:
-            end_time = datetime.now()
-            response_time = (end_time - start_time).total_seconds()
-            result = {
-                "url": url,
-                "status_code": 0,
-                "response_time": response_time,
-                "success": False,
-                "timestamp": start_time.isoformat(),
-                "error": str(e)
-            }
+            response_time = loop.time() - start
+            result = self._make_result(url, 0, response_time, False, timestamp, str(e))
             logger.error(f"Error pinging {url}: {e}")
             return result
     
-    async def ping_all_urls(self) -> Dict[str, Dict[str, Any]]:
-        """Ping all monitored URLs concurrently"""
-        url_to_admin = self.data_manager.get_all_urls()
-        
-        if not url_to_admin:
-            logger.debug("No URLs to ping")
-            return {}
-        
-        # Create ping tasks for all URLs
-        ping_tasks = [self.ping_url(url) for url in url_to_admin.keys()]
-        
-        # Execute all pings concurrently
-        results = await asyncio.gather(*ping_tasks, return_exceptions=True)
+    @staticmethod
+    def _make_result(url: str, status_code: int, response_time: float, success: bool,
+                     timestamp: str, error: Optional[str]) -> Dict[str, Any]:
+        """Build a ping result; every field is already a JSON-native type (timestamp is ISO 8601)"""
+        return {
+            "url": url,
+            "status_code": status_code,
+            "response_time": response_time,
+            "success": success,
+            "timestamp": timestamp,
+            "error": error
+        }
+    
+    async def _ping_bounded(self, url: str, semaphore: asyncio.Semaphore, timestamp: Optional[str] = None) -> Dict[str, Any]:
+        """Ping a URL once a slot in the semaphore is free"""
+        async with semaphore:
+            return await self.ping_url(url, timestamp)
+    
+    def _store_results(self, results: List[Dict[str, Any]], admins: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Record a batch of ping results with a single save and queue alerts for down URLs
         
-        # Process results
+        admins runs parallel to results: admins[i] owns the URL of results[i].
+        """
         ping_results = {}
-        for result in results:
-            if isinstance(result, Exception):
-                logger.error(f"Ping task failed: {result}")
-                continue
-            
+        updates = []
+        changed_urls = set()
+        needs_save = False
+        for admin_id, result in zip(admins, results):
             url = result["url"]
-            ping_results[url] = result
-            
-            # Update data manager for the URL owner
-            admin_id = url_to_admin[url]
-            self.data_manager.update_url_status(
-                url=url,
-                admin_chat_id=admin_id,
-                status_code=result["status_code"],
-                response_time=result["response_time"],
-                success=result["success"]
-            )
+            if url not in ping_results:
+                ping_results[url] = result
+                state = (result["status_code"], result["success"])
+                last = self._last_status.get(url)
+                if last is None or last[0] != state:
+                    changed_urls.add(url)
+                if url in changed_urls or last[1] + 1 >= self.status_save_every:
+                    self._last_status[url] = (state, 0)
+                    needs_save = True
+                else:
+                    self._last_status[url] = (state, last[1] + 1)
+            updates.append({
+                "url": url,
+                "admin_chat_id": admin_id,
+                "status_code": result["status_code"],
+                "response_time": result["response_time"],
+                "success": result["success"]
+            })
             
-            # Send alert if URL is down
+            # Alert only the URL's owner when it is down
             if not result["success"]:
-                await self._send_alert(result, admin_id)
+                self._queue_alert(result, admin_id)
+        
+        if updates:
+            self.data_manager.bulk_update_url_status(updates, save=False)
+            # Only a status change bumps the version; fresher check times and response
+            # times reach readers once the get_urls snapshot expires
+            for admin_id in {update["admin_chat_id"] for update in updates if update["url"] in changed_urls}:
+                self._invalidate_urls(admin_id)
+            # Unchanged results still update memory (last check, history); only the disk write waits
+            if needs_save:
+                self._schedule_save()
+            else:
+                self._has_unsaved_results = True
         
-        logger.info(f"Completed ping cycle for {len(ping_results)} URLs")
         return ping_results
     
-    async def ping_admin_urls(self, admin_chat_id: str) -> Dict[str, Dict[str, Any]]:
-        """Ping only URLs belonging to a specific admin"""
+    def _schedule_save(self):
+        """Coalesce status saves from concurrent pings into one background write"""
+        if self._save_handle is None:
+            self._save_handle = asyncio.get_running_loop().call_later(self.save_delay, self._flush_save)
+    
+    def _flush_save(self):
+        """Write the data file off the event loop once the save delay has passed"""
+        self._save_handle = None
+        self._has_unsaved_results = False
+        self._save_task = asyncio.ensure_future(self.data_manager.save_data_async())
+    
+    async def _probe_and_handle(self, url: str, admin_ids: Iterable[str],
+                                semaphore: Optional[asyncio.Semaphore] = None,
+                                timestamp: Optional[str] = None) -> Dict[str, Any]:
+        """Ping a URL and record the result for every admin that owns it right away"""
+        if semaphore is None:
+            result = await self.ping_url(url, timestamp)
+        else:
+            result = await self._ping_bounded(url, semaphore, timestamp)
+        # One ping serves every owner
+        admin_ids = tuple(admin_ids)
+        self._store_results([result] * len(admin_ids), admin_ids)
+        return result
+    
+    async def ping_admin_urls(self, admin_chat_id: str, on_progress: Optional[Callable[[int, int], None]] = None) -> Dict[str, Dict[str, Any]]:
+        """Ping only URLs belonging to a specific admin
+        
+        on_progress, if given, is called as on_progress(done, total) each time a ping finishes.
+        """
         admin_urls = self.data_manager.get_urls(admin_chat_id)
         
         if not admin_urls:
             logger.debug(f"No URLs to ping for admin {admin_chat_id}")
             return {}
         
-        # Create ping tasks for this admin's URLs only
-        ping_tasks = [self.ping_url(url) for url in admin_urls.keys()]
-        
-        # Execute all pings concurrently
-        results = await asyncio.gather(*ping_tasks, return_exceptions=True)
-        
-        # Process results
-        ping_results = {}
-        for result in results:
-            if isinstance(result, Exception):
-                logger.error(f"Ping task failed: {result}")
-                continue
-            
-            url = result["url"]
-            ping_results[url] = result
-            
-            # Update data manager for this admin
-            self.data_manager.update_url_status(
-                url=url,
-                admin_chat_id=admin_chat_id,
-                status_code=result["status_code"],
-                response_time=result["response_time"],
-                success=result["success"]
-            )
+        # Ping this admin's URLs only, at most max_concurrent_pings in flight; each
+        # task records its own result as soon as it lands
+        semaphore = asyncio.Semaphore(self.max_concurrent_pings)
+        owner = (admin_chat_id,)
+        cycle_timestamp = datetime.now().isoformat()  # Shared by every result of this batch
+        async with asyncio.TaskGroup() as group:
+            ping_tasks = [
+                group.create_task(self._probe_and_handle(url, owner, semaphore, cycle_timestamp))
+                for url in admin_urls
+            ]
             
-            # Send alert if URL is down (only to this admin)
-            if not result["success"]:
-                await self._send_alert(result, admin_chat_id)
+            if on_progress is not None:
+                total = len(ping_tasks)
+                done_count = 0
+                
+                def _count_done(_task):
+                    nonlocal done_count
+                    done_count += 1
+                    on_progress(done_count, total)
+                
+                for task in ping_tasks:
+                    task.add_done_callback(_count_done)
+        
+        # Results in URL order, not completion order
+        ping_results = {url: task.result() for url, task in zip(admin_urls, ping_tasks)}
         
         logger.info(f"Completed ping cycle for {len(ping_results)} URLs for admin {admin_chat_id}")
         return ping_results
     
+    def _queue_alert(self, ping_result: Dict[str, Any], admin_chat_id: str):
+        """Hand a down alert to the alert workers so pings never wait on Telegram"""
+        if self._closed:
+            logger.warning(f"Dropping alert for {ping_result['url']} to admin {admin_chat_id}: monitor is closed")
+            return
+        if self._alert_queue is None:
+            self._alert_queue = asyncio.Queue()
+            self._alert_tasks = [asyncio.create_task(self._alert_worker()) for _ in range(self.alert_workers)]
+        self._alert_queue.put_nowait((ping_result, admin_chat_id))
+    
+    async def _alert_worker(self):
+        """Send queued alerts one at a time"""
+        while True:
+            ping_result, admin_chat_id = await self._alert_queue.get()
+            try:
+                await self._send_alert(ping_result, admin_chat_id)
+            finally:
+                self._alert_queue.task_done()
+    
     async def _send_alert(self, ping_result: Dict[str, Any], admin_chat_id: str):
         """Send alert to specific admin when URL is down"""
         if not self.bot_instance:
@@ -176,20 +327,22 @@ class URLMonitor:
         error = ping_result.get("error", "Unknown error")
         response_time = ping_result["response_time"]
         
-        # Create alert message
-        alert_msg = f"🚨 **URL DOWN ALERT** 🚨\n\n"
-        alert_msg += f"**URL:** `{url}`\n"
-        alert_msg += f"**Status Code:** {status_code}\n"
-        alert_msg += f"**Response Time:** {response_time:.3f}s\n"
-        alert_msg += f"**Error:** {error}\n"
-        alert_msg += f"**Time:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-        alert_msg += "Please check the URL status immediately."
+        # Create alert message; a queued alert can outlive its URL, so read the
+        # display cache without filling it back in for a removed entry
+        alert_msg = ALERT_TEMPLATE.format(
+            url=self._url_display_cache.get((url, None)) or html.escape(url),
+            status=status_code,
+            rt=response_time,
+            err=html.escape(str(error)),
+            # The ping's own ISO timestamp, cut to "YYYY-MM-DD HH:MM:SS" without another strftime
+            ts=ping_result["timestamp"][:19].replace("T", " ")
+        )
         
         try:
             await self.bot_instance.send_message(
                 chat_id=admin_chat_id,
                 text=alert_msg,
-                parse_mode='Markdown'
+                parse_mode='HTML'
             )
             logger.info(f"Alert sent for {url} to admin {admin_chat_id}")
         except Exception as e:
@@ -202,25 +355,23 @@ class URLMonitor:
             return
         
         self.is_running = True
+        self._closed = False
+        self._monitoring_task = asyncio.current_task()
         logger.info(f"Starting URL monitoring with {self.ping_interval}s interval")
+        # Open the connection pool once up front; every ping reuses it
+        self._get_session()
         
         try:
-            while self.is_running:
-                start_time = datetime.now()
-                
-                # Ping all URLs
-                await self.ping_all_urls()
-                
-                # Calculate sleep time to maintain consistent interval
-                elapsed_time = (datetime.now() - start_time).total_seconds()
-                sleep_time = max(0, self.ping_interval - elapsed_time)
-                
-                if sleep_time > 0:
-                    logger.debug(f"Sleeping for {sleep_time:.1f}s until next ping cycle")
-                    await asyncio.sleep(sleep_time)
-                else:
-                    logger.warning(f"Ping cycle took {elapsed_time:.1f}s, longer than interval of {self.ping_interval}s")
-                
+            # One long-lived loop per distinct URL, so a slow or hanging site only delays
+            # its own pings; the parallel lists give each URL's owners without a lookup
+            urls, owners = self.data_manager.get_all_urls_as_arrays()
+            for url, admin_ids in zip(urls, owners):
+                for admin_id in admin_ids:
+                    self._start_url_task(url, admin_id)
+            
+            # Runs until cancelled by stop_monitoring or shutdown
+            await asyncio.get_running_loop().create_future()
+            
         except asyncio.CancelledError:
             logger.info("Monitoring loop cancelled")
             raise
@@ -229,18 +380,105 @@ class URLMonitor:
             raise
         finally:
             self.is_running = False
+            tasks = list(self._url_tasks.values())
+            self._url_tasks.clear()
+            self._url_owners.clear()
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
             logger.info("URL monitoring stopped")
     
+    def _start_url_task(self, url: str, admin_chat_id: str):
+        """Add an owner to a URL's ping loop, starting the loop if monitoring is running and it has none yet"""
+        if not self.is_running:
+            return
+        self._url_owners.setdefault(url, set()).add(admin_chat_id)
+        if url in self._url_tasks:
+            return
+        
+        task = asyncio.get_running_loop().create_task(self._url_loop(url))
+        self._url_tasks[url] = task
+        
+        def _forget(done_task):
+            if self._url_tasks.get(url) is done_task:
+                del self._url_tasks[url]
+        
+        task.add_done_callback(_forget)
+    
+    def _stop_url_task(self, url: str, admin_chat_id: str):
+        """Remove an owner from a URL's ping loop, cancelling the loop once nobody monitors the URL"""
+        owners = self._url_owners.get(url)
+        if owners is None:
+            return
+        owners.discard(admin_chat_id)
+        if owners:
+            return
+        
+        del self._url_owners[url]
+        task = self._url_tasks.pop(url, None)
+        if task is not None:
+            task.cancel()
+    
+    async def _url_loop(self, url: str):
+        """Ping one URL every ping_interval until monitoring stops or nobody monitors it
+        
+        While the URL has failed within the last failure_memory pings, the interval is
+        scaled by failing_interval_factor.
+        """
+        loop = asyncio.get_running_loop()
+        # Random start offset so the URLs do not all fire in the same instant
+        await asyncio.sleep(random.uniform(0, 0.1 * self.ping_interval))
+        
+        # Sleep to absolute deadlines so measurement overhead never accumulates as drift
+        next_tick = loop.time()
+        recent_failures = 0  # Set on failure, decays by one per healthy ping
+        while self.is_running:
+            try:
+                # Recorded for the owners current at this moment
+                result = await self._probe_and_handle(url, self._url_owners.get(url, ()))
+                if result["success"]:
+                    recent_failures = max(0, recent_failures - 1)
+                else:
+                    recent_failures = self.failure_memory
+            except Exception as e:
+                logger.error(f"Error monitoring {url}: {e}")
+            
+            interval = self.ping_interval * (self.failing_interval_factor if recent_failures else 1.0)
+            next_tick += interval
+            sleep_time = next_tick - loop.time()
+            if sleep_time > 0:
+                await asyncio.sleep(sleep_time)
+            else:
+                logger.warning(f"Pinging {url} overran its {interval:.0f}s interval by {-sleep_time:.1f}s")
+                # Skip the missed ticks rather than firing them back to back
+                next_tick = loop.time()
+    
     def stop_monitoring(self):
         """Stop the monitoring loop"""
         self.is_running = False
         if self._monitoring_task:
             self._monitoring_task.cancel()
+        # Release pooled connections; a later ping opens a fresh pool on demand
+        try:
+            asyncio.get_running_loop().create_task(self.close())
+        except RuntimeError:
+            pass  # No running loop, nothing can be using the session
         logger.info("Monitoring stop requested")
     
-    def get_monitoring_status(self) -> Dict[str, Any]:
-        """Get current monitoring status"""
-        urls = self.data_manager.get_urls()
+    def get_monitoring_status(self, admin_chat_id: str) -> Dict[str, Any]:
+        """Get current monitoring status for specific admin
+        
+        The result is shared between callers until the admin's URLs change, monitoring
+        starts or stops, or status_cache_ttl passes; treat it as read-only.
+        """
+        now = time.monotonic()
+        version = self.get_urls_version(admin_chat_id)
+        cached = self._status_cache.get(admin_chat_id)
+        if (cached is not None and now - cached[0] < self.status_cache_ttl
+                and cached[1] == version and cached[2] == self.is_running):
+            return cached[3]
+        
+        urls = self.get_urls(admin_chat_id)
         
         status = {
             "is_running": self.is_running,
@@ -257,24 +495,129 @@ class URLMonitor:
                 "response_time": data.get("response_time")
             }
         
+        self._status_cache[admin_chat_id] = (now, version, self.is_running, status)
         return status
     
-    def add_url(self, url: str, admin_chat_id: str) -> bool:
-        """Add a URL to monitoring for specific admin"""
-        # Basic URL validation
+    def _normalize_url(self, url: str) -> str:
+        """Add https:// when no protocol is given"""
         if not url.startswith(('http://', 'https://')):
             url = 'https://' + url
+        return url
+    
+    def add_url(self, url: str, admin_chat_id: str, save: bool = True) -> bool:
+        """Add a URL to monitoring for specific admin"""
+        # Basic URL validation
+        url = self._normalize_url(url)
+        if not validate_url(url):
+            logger.warning(f"Rejected malformed URL {url} for admin {admin_chat_id}")
+            return False
+        
+        if not self.data_manager.add_url(url, admin_chat_id, save=save):
+            return False
+        self._invalidate_urls(admin_chat_id)
         
-        return self.data_manager.add_url(url, admin_chat_id)
+        url_id = self.data_manager.get_url_id(url, admin_chat_id)
+        self._by_id[url_id] = (admin_chat_id, url)
+        self.url_html(url)
+        self._start_url_task(url, admin_chat_id)
+        return True
     
-    def remove_url(self, url: str, admin_chat_id: str) -> bool:
+    def remove_url(self, url: str, admin_chat_id: str, save: bool = True) -> bool:
         """Remove a URL from monitoring for specific admin"""
-        return self.data_manager.remove_url(url, admin_chat_id)
+        url_id = self.data_manager.get_url_id(url, admin_chat_id)
+        
+        if not self.data_manager.remove_url(url, admin_chat_id, save=save):
+            return False
+        self._invalidate_urls(admin_chat_id)
+        
+        self._by_id.pop(url_id, None)
+        self._stop_url_task(url, admin_chat_id)
+        # Status and display text are shared by every owner; keep them while anyone still monitors the URL
+        if not self.data_manager.is_url_monitored(url):
+            self._last_status.pop(url, None)
+            for key in [key for key in self._url_display_cache if key[0] == url]:
+                del self._url_display_cache[key]
+        return True
+    
+    async def aadd_url(self, url: str, admin_chat_id: str) -> bool:
+        """Add a URL in memory right away and persist it without blocking the event loop"""
+        if not self.add_url(url, admin_chat_id, save=False):
+            return False
+        await self.data_manager.save_data_async()
+        return True
+    
+    async def aremove_url(self, url: str, admin_chat_id: str) -> bool:
+        """Remove a URL in memory right away and persist it without blocking the event loop"""
+        if not self.remove_url(url, admin_chat_id, save=False):
+            return False
+        await self.data_manager.save_data_async()
+        return True
+    
+    def get_url_id(self, url: str, admin_chat_id: str) -> Optional[int]:
+        """Get the stable callback id of a URL for specific admin"""
+        return self.data_manager.get_url_id(self._normalize_url(url), admin_chat_id)
+    
+    def get_url_by_id(self, url_id: int, admin_chat_id: str) -> Optional[str]:
+        """Resolve a callback id back to the URL it belongs to for specific admin"""
+        entry = self._by_id.get(url_id)
+        if entry is None or entry[0] != admin_chat_id:
+            return None
+        return entry[1]
+    
+    def get_url_data(self, url: str, admin_chat_id: str) -> Optional[Dict[str, Any]]:
+        """Get the record of a single monitored URL for specific admin"""
+        return self.data_manager.get_url_data(url, admin_chat_id)
+    
+    def url_html(self, url: str, max_length: Optional[int] = None) -> str:
+        """Get the HTML-escaped display form of a URL, optionally cut to max_length characters
+        
+        Escaping happens once per URL and length; the result is reused by every render.
+        """
+        key = (url, max_length)
+        text = self._url_display_cache.get(key)
+        if text is None:
+            shown = url if max_length is None or len(url) <= max_length else f"{url[:max_length]}..."
+            text = html.escape(shown)
+            self._url_display_cache[key] = text
+        return text
+    
+    def _invalidate_urls(self, admin_chat_id: str):
+        """Drop the cached snapshot and bump the version after an admin's URLs change"""
+        self._url_cache.pop(admin_chat_id, None)
+        self._url_versions[admin_chat_id] = self._url_versions.get(admin_chat_id, 0) + 1
+    
+    def get_urls_version(self, admin_chat_id: str) -> int:
+        """Get a counter that changes whenever an admin's URLs or their statuses change"""
+        return self._url_versions.get(admin_chat_id, 0)
     
     def get_urls(self, admin_chat_id: str) -> Dict[str, Dict[str, Any]]:
-        """Get all monitored URLs for specific admin"""
-        return self.data_manager.get_urls(admin_chat_id)
+        """Get all monitored URLs for specific admin
+        
+        The snapshot is shared between callers for up to url_cache_ttl seconds and
+        dropped whenever the admin's URLs or their statuses change; treat it as read-only.
+        """
+        now = time.monotonic()
+        cached = self._url_cache.get(admin_chat_id)
+        if cached is not None and now - cached[0] < self.url_cache_ttl:
+            return cached[1]
+        
+        urls = self.data_manager.get_urls(admin_chat_id)
+        self._url_cache[admin_chat_id] = (now, urls)
+        return urls
     
     def get_uptime_stats(self, url: str, admin_chat_id: str, hours: int = 24) -> Dict[str, Any]:
         """Get uptime statistics for a URL for specific admin"""
         return self.data_manager.get_uptime_stats(url, admin_chat_id, hours)
+    
+    async def aget_uptime_stats(self, urls: Iterable[str], admin_chat_id: str, hours: int = 24) -> List[Dict[str, Any]]:
+        """Get uptime statistics for several URLs for specific admin, in URL order
+        
+        The histories are copied on the event loop, where pings append to them, and
+        the stats are computed from the copies in the default executor.
+        """
+        loop = asyncio.get_running_loop()
+        histories = [self.data_manager.get_ping_history(url, admin_chat_id) for url in urls]
+        return await asyncio.gather(*(
+            loop.run_in_executor(None, self.data_manager.compute_uptime_stats, history, hours)
+            for history in histories
+        ))
@@ -2,37 +2,70 @@
 Utility functions for the Telegram URL Monitor Bot
 """
 
+import html
+import json
+import os
 import re
 import logging
-from datetime import datetime
+import zlib
+from datetime import datetime, timedelta
 from typing import Dict, Any, List
 from urllib.parse import urlparse
 
+try:
+    import orjson  # Optional: much faster JSON parsing/serialization
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# http(s) scheme, optional user:pass@, a host name (trailing dot allowed) or bracketed
+# IPv6 address, optional port 1-65535, then an optional path/query/fragment
+URL_RE = re.compile(
+    r'^https?://'
+    r'(?:[^\s/?#@]+@)?'
+    r'(?:[\w\-]+(?:\.[\w\-]+)*\.?|\[[0-9A-Fa-f:.]+\])'
+    r'(?::(?:6553[0-5]|655[0-2]\d|65[0-4]\d{2}|6[0-4]\d{3}|[1-5]\d{4}|[1-9]\d{0,3}))?'
+    r'(?:[/?#]\S*)?$'
+)
+
+def load_json_file(path: str) -> Any:
+    """Parse a JSON file, using orjson when it is installed"""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def dump_json(data: Any) -> bytes:
+    """Serialize data as indented UTF-8 JSON, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+def write_file_atomic(path: str, raw: bytes):
+    """Write bytes via a temp file so readers never see a partial file"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(raw)
+    os.replace(tmp_path, path)
+
 def validate_url(url: str) -> bool:
     """Validate if a string is a valid URL"""
-    try:
-        # Add https:// if no protocol specified
-        if not url.startswith(('http://', 'https://')):
-            url = 'https://' + url
-        
-        # Parse the URL
-        result = urlparse(url)
-        
-        # Check if it has both scheme and netloc
-        return all([result.scheme, result.netloc])
+    # Add https:// if no protocol specified
+    if not url.startswith(('http://', 'https://')):
+        url = 'https://' + url
     
-    except Exception as e:
-        logger.debug(f"URL validation error for '{url}': {e}")
-        return False
+    # A single match checks scheme, host and port; malformed hosts would otherwise
+    # fail a DNS lookup on every ping cycle
+    return URL_RE.match(url) is not None
 
 def format_url_list(urls: Dict[str, Dict[str, Any]]) -> str:
     """Format the list of URLs for display"""
     if not urls:
         return "📭 No URLs are currently being monitored."
     
-    message = f"📋 **Monitored URLs ({len(urls)})**\n\n"
+    message = f"📋 <b>Monitored URLs ({len(urls)})</b>\n\n"
     
     for url, data in urls.items():
         # Get status info
@@ -51,16 +84,13 @@ def format_url_list(urls: Dict[str, Dict[str, Any]]) -> str:
             status_icon = "⏳"
             status_text = "Pending"
         
-        message += f"{status_icon} **{status_text}**\n"
-        message += f"   `{url}`\n"
+        message += f"{status_icon} <b>{status_text}</b>\n"
+        message += f"   <code>{html.escape(url)}</code>\n"
         
         if last_check:
-            try:
-                check_time = datetime.fromisoformat(last_check)
-                time_str = check_time.strftime("%H:%M:%S")
-                message += f"   Last check: {time_str}"
-            except:
-                message += f"   Last check: {last_check}"
+            # Stored timestamps are ISO strings, so the time sits at a fixed offset
+            time_str = data.get("last_check_hms") or last_check[11:19]
+            message += f"   Last check: {time_str}"
         else:
             message += "   Last check: Never"
         
@@ -87,8 +117,8 @@ def format_uptime_message(url: str, stats: Dict[str, Any]) -> str:
     else:
         status_icon = "🔴"
     
-    message = f"{status_icon} **{uptime}% Uptime**\n"
-    message += f"   `{url}`\n"
+    message = f"{status_icon} <b>{uptime}% Uptime</b>\n"
+    message += f"   <code>{html.escape(url)}</code>\n"
     
     if total_pings > 0:
         message += f"   Checks: {successful_pings}✅ / {failed_pings}❌ (Total: {total_pings})\n"
@@ -187,21 +217,27 @@ def create_url_keyboard(urls: List[str], action_prefix: str):
         
         # Telegram callback data limit is 64 characters
         if len(callback_data) > 64:
-            # Use URL hash or truncate
-            import hashlib
-            url_hash = hashlib.md5(url.encode()).hexdigest()[:8]
+            # Use a short stable checksum of the URL; it only needs to be an id, not secure
+            url_hash = f"{zlib.crc32(url.encode()):08x}"
             callback_data = f"{action_prefix}:{url_hash}"
         
         keyboard.append([InlineKeyboardButton(display_url, callback_data=callback_data)])
     
     return InlineKeyboardMarkup(keyboard)
 
+def retry_after_seconds(error) -> float:
+    """Get the flood-control wait of a Telegram RetryAfter error in seconds"""
+    delay = error.retry_after
+    if isinstance(delay, timedelta):
+        return delay.total_seconds()
+    return float(delay)
+
 def format_error_message(error: Exception, context: str = "") -> str:
     """Format error message for user display"""
-    error_msg = "❌ **An error occurred**\n\n"
+    error_msg = "❌ <b>An error occurred</b>\n\n"
     if context:
-        error_msg += f"**Context:** {context}\n"
-    error_msg += f"**Error:** {str(error)}\n\n"
+        error_msg += f"<b>Context:</b> {html.escape(context)}\n"
+    error_msg += f"<b>Error:</b> {html.escape(str(error))}\n\n"
     error_msg += "Please try again or contact the administrator if the problem persists."
     return error_msg
 